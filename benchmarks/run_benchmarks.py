@@ -0,0 +1,263 @@
+# Menu Creator benchmark suite
+#
+# Generates a synthetic scene and times the most expensive parts of the addon.
+# Run it from the root of the repository with:
+#
+#   blender --background --factory-startup --python benchmarks/run_benchmarks.py -- [options]
+#
+# Options (all optional):
+#   --menus N        number of objects with a menu
+#   --props M        number of properties in each menu
+#   --links K        number of linked properties in each menu
+#   --collections C  number of collection sections in each menu
+#   --outfits O      number of outfit objects in each collection section, each with a mask modifier on the body
+#   --repeat R       number of timed runs of each benchmark
+#   --output FILE    write the results to FILE as JSON, instead of printing them
+#
+# The entry points of the addon need Blender: the algorithms they rely on can be timed without it by
+# run_core_benchmarks.py, but there is no bpy stand-in to run the addon itself outside of Blender.
+#
+# The results contain the Blender and addon versions, the scene parameters and, for each benchmark,
+# the minimum, median, mean and maximum time in milliseconds, so that runs of different releases can be compared.
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+import bpy
+
+# The addon is imported from the repository, not from the installed addons
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import menu_creator as mc
+
+
+# Arguments
+
+def parse_args():
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="run_benchmarks.py", description="Menu Creator benchmark suite")
+    parser.add_argument("--menus", type=int, default=10)
+    parser.add_argument("--props", type=int, default=100)
+    parser.add_argument("--links", type=int, default=50)
+    parser.add_argument("--collections", type=int, default=4)
+    parser.add_argument("--outfits", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default="")
+
+    args = parser.parse_args(argv)
+    if args.menus < 1:
+        parser.error("--menus must be at least 1")
+
+    return args
+
+
+# Synthetic scene generator
+
+# Number of default sections the properties are distributed in
+default_sections = 4
+
+def new_mesh_object(name, collection):
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata([(0., 0., 0.), (1., 0., 0.), (0., 1., 0.)], [], [(0, 1, 2)])
+    obj = bpy.data.objects.new(name, mesh)
+    collection.objects.link(obj)
+
+    return obj
+
+def set_active(obj):
+    bpy.context.view_layer.objects.active = obj
+
+# Function to create a menu object with its properties, links, sections and outfits
+def generate_menu(index, args):
+
+    scene = bpy.context.scene
+    obj = new_mesh_object("Bench_Menu_" + str(index), scene.collection)
+    set_active(obj)
+    bpy.ops.mc.initialconfig()
+
+    # Properties, distributed in the default sections
+    for s in range(default_sections):
+        bpy.ops.mc.addsection(name="Section " + str(s), type="DEFAULT")
+    for p in range(args.props):
+        obj["bench_prop_" + str(p)] = 0.
+    for s in range(default_sections):
+        properties = [(obj, "bench_prop_" + str(p)) for p in range(s, args.props, default_sections)]
+        mc.mc_add_properties(obj, properties, "Section " + str(s))
+
+    # Linked properties, on a separate object
+    target = new_mesh_object("Bench_Target_" + str(index), scene.collection)
+    # Links are distributed on the properties, so a menu without properties has no links
+    for k in range(args.links if args.props > 0 else 0):
+        target["bench_link_" + str(k)] = 0.
+        item = mc.mc_property_item(target, "bench_link_" + str(k))
+        source = mc.mc_property_item(obj, "bench_prop_" + str(k % args.props))
+        i = mc.mc_property_index(obj)[(source[1], source[2])]
+        mc.mc_link_property(obj, i, item, mc.mc_rna_signature(target, item[2]))
+
+    # Collection sections, with an outfit body masked by the outfit objects
+    body = new_mesh_object("Bench_Body_" + str(index), scene.collection)
+    for c in range(args.collections):
+        name = "Outfit " + str(c)
+        bpy.ops.mc.addsection(name=name, type="COLLECTION")
+        sec = obj.mc_sections[mc.mc_find_index_section(obj.mc_sections, name)]
+        collection = bpy.data.collections.new("Bench_Outfit_" + str(index) + "_" + str(c))
+        scene.collection.children.link(collection)
+        for o in range(args.outfits):
+            outfit = new_mesh_object("Bench_Cloth_" + str(index) + "_" + str(c) + "_" + str(o), collection)
+            outfit.modifiers.new("Shrinkwrap", "SHRINKWRAP")
+            mask = body.modifiers.new("Mask " + outfit.name, "MASK")
+            mask.show_viewport = False
+        item = sec.collections.add()
+        item.collection = collection
+        sec.outfit_enable = True
+        sec.outfit_body = body
+
+    return obj
+
+def generate_scene(args):
+
+    mc.mc_registry_clear()
+    mc.mc_menu_caches_clear()
+    mc.mc_links_invalidate(clear_cache=True)
+
+    return [generate_menu(i, args) for i in range(args.menus)]
+
+
+# Layout stand-in, to run the panel draw code without a window
+
+class RecordingLayout:
+
+    def __init__(self):
+        self.calls = 0
+
+    def __getattr__(self, name):
+
+        def method(*args, **kwargs):
+            self.calls = self.calls + 1
+            if name in {"row", "column", "box", "split", "column_flow", "grid_flow"}:
+                return self
+            return SimpleNamespace()
+
+        return method
+
+
+# Timing
+
+def measure(name, run, repeat, setup=None):
+
+    times = []
+    for r in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000.)
+
+    return name, {"repeat": repeat,
+                  "min_ms": min(times),
+                  "median_ms": statistics.median(times),
+                  "mean_ms": statistics.mean(times),
+                  "max_ms": max(times)}
+
+def run_benchmarks(objects, args):
+
+    results = {}
+    scene = bpy.context.scene
+    obj = objects[0]
+    set_active(obj)
+
+    # Panel draw, in edit mode so that all the buttons are drawn
+    scene.mc_settings.ms_editmode = True
+    obj.mc_edit_enable = True
+    panel = SimpleNamespace(layout=RecordingLayout())
+    name, result = measure("PT_MenuCreator_Panel.draw",
+                           lambda: mc.PT_MenuCreator_Panel.draw(panel, bpy.context), args.repeat)
+    results[name] = result
+    obj.mc_edit_enable = False
+    scene.mc_settings.ms_editmode = False
+    name, result = measure("PT_MenuCreator_Panel.draw (user mode)",
+                           lambda: mc.PT_MenuCreator_Panel.draw(panel, bpy.context), args.repeat)
+    results[name] = result
+
+    # Handler: a change to one menu object, and a full sync as done after undo
+    values = iter(range(1, 1000000))
+    def change():
+        obj["bench_prop_0"] = float(next(values))
+    depsgraph = SimpleNamespace(updates=[SimpleNamespace(id=obj)])
+    name, result = measure("mc_scene_modification_handler",
+                           lambda: mc.mc_scene_modification_handler(scene, depsgraph), args.repeat, change)
+    results[name] = result
+    name, result = measure("mc_scene_modification_handler (full sync)",
+                           lambda: mc.mc_scene_modification_handler(scene), args.repeat, change)
+    results[name] = result
+
+    # Property move, alternately down and up
+    if len(obj.mc_properties) > 0:
+        el = [obj.mc_properties[0].name, obj.mc_properties[0].path, obj.mc_properties[0].id]
+        directions = itertools.cycle([False, True])
+        name, result = measure("MC_SwapProperty",
+                               lambda: bpy.ops.mc.swapprops(mod=next(directions), name=el[0], path=el[1], id=el[2]), args.repeat)
+        results[name] = result
+
+    # Section deletion, of a section created before each run
+    def add_section():
+        bpy.ops.mc.addsection(name="Bench Delete", type="DEFAULT")
+    name, result = measure("MC_DeleteSection",
+                           lambda: bpy.ops.mc.deletesection(name="Bench Delete"), args.repeat, add_section)
+    results[name] = result
+
+    # Outfit functions
+    if args.collections > 0 and args.outfits > 0:
+        sec = obj.mc_sections[mc.mc_find_index_section(obj.mc_sections, "Outfit 0")]
+        outfit = sec.collections[0].collection.objects[0]
+        name, result = measure("MC_CollectionObjectVisibility",
+                               lambda: bpy.ops.mc.colobjvisibility(obj=outfit.name, sec=sec.name), args.repeat)
+        results[name] = result
+        name, result = measure("mc_collections_global_options_update",
+                               lambda: sec.mc_collections_global_options_update(bpy.context), args.repeat)
+        results[name] = result
+
+    return results
+
+
+def main():
+
+    args = parse_args()
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    mc.register()
+    try:
+        start = time.perf_counter()
+        objects = generate_scene(args)
+        generation = (time.perf_counter() - start) * 1000.
+        results = run_benchmarks(objects, args)
+    finally:
+        mc.unregister()
+
+    output = {"blender": bpy.app.version_string,
+              "addon": ".".join(str(v) for v in mc.bl_info["version"]),
+              "backend": "bpy",
+              "parameters": {"menus": args.menus,
+                             "props": args.props,
+                             "links": args.links,
+                             "collections": args.collections,
+                             "outfits": args.outfits},
+              "generation_ms": generation,
+              "results": results}
+
+    if args.output != "":
+        with open(args.output, 'w') as file:
+            json.dump(output, file, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# Menu Creator core benchmark suite
+#
+# Times the algorithms of menu_creator/core.py on synthetic plain Python menus, without Blender.
+# Run it from the root of the repository with:
+#
+#   python benchmarks/run_core_benchmarks.py [options]
+#
+# The options and the output are the same of run_benchmarks.py, which runs the addon inside Blender.
+# The output has "backend": "python", so that the two kinds of results can be told apart.
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+
+# The core module does not depend on bpy, so it is imported without the addon package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "menu_creator"))
+import core
+
+
+# Arguments
+
+def parse_args():
+
+    parser = argparse.ArgumentParser(prog="run_core_benchmarks.py", description="Menu Creator core benchmark suite")
+    parser.add_argument("--menus", type=int, default=10)
+    parser.add_argument("--props", type=int, default=100)
+    parser.add_argument("--links", type=int, default=50)
+    parser.add_argument("--collections", type=int, default=4)
+    parser.add_argument("--outfits", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default="")
+
+    args = parser.parse_args()
+    if args.menus < 1:
+        parser.error("--menus must be at least 1")
+
+    return args
+
+
+# Synthetic menu generator
+
+# Number of default sections the properties are distributed in
+default_sections = 4
+
+# Function to create a menu with its properties, links and collection sections
+def generate_menu(index, args):
+
+    menu = core.MCMenu("Bench_Menu_" + str(index))
+    path = 'bpy.data.objects["' + menu.name + '"]'
+
+    for s in range(default_sections):
+        menu.mc_sections.append(core.MCSection("Section " + str(s), (s + 1) * core.mc_order_step))
+    for c in range(args.collections):
+        section = core.MCSection("Outfit " + str(c), (default_sections + c + 1) * core.mc_order_step, "COLLECTION")
+        section.collections = [core.MCCollection("Bench_Outfit_" + str(index) + "_" + str(c))]
+        menu.mc_sections.append(section)
+
+    for p in range(args.props):
+        section = "Section " + str(p % default_sections)
+        menu.mc_properties.append(core.MCProperty("bench_prop_" + str(p), path, '["bench_prop_' + str(p) + '"]', section, (p // default_sections) * core.mc_order_step))
+
+    # Links are distributed on the properties, so a menu without properties has no links
+    target = 'bpy.data.objects["Bench_Target_' + str(index) + '"]'
+    for k in range(args.links if args.props > 0 else 0):
+        link = core.MCLinkedProperty(target, '["bench_link_' + str(k) + '"]')
+        link.map_enable = k % 2 == 0
+        link.map_factor = 0.5
+        link.map_clamp = True
+        menu.mc_properties[k % args.props].linked_props.append(link)
+
+    return menu
+
+# Accessor and link group stand-ins for the link graph, identified by the property path
+class BenchAccessor:
+
+    def __init__(self, path, id):
+        self.identity = (path, id)
+
+class BenchLinkGroup:
+
+    def __init__(self, prop):
+        self.name = prop.name
+        self.inputs = [BenchAccessor(prop.path, prop.id)]
+        self.outputs = [BenchAccessor(l.path, l.id) for l in prop.linked_props]
+
+# Function to create link groups where the targets of each menu are the sources of the next one
+def generate_link_groups(menus):
+
+    groups = []
+    for menu in menus:
+        for prop in menu.mc_properties:
+            if len(prop.linked_props) > 0:
+                groups.append(BenchLinkGroup(prop))
+
+    sources = [g.inputs[0] for g in groups]
+    for group, source in zip(groups, sources[1:]):
+        group.outputs.append(source)
+
+    return groups
+
+
+# Timing
+
+def measure(name, run, repeat, setup=None):
+
+    times = []
+    for r in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000.)
+
+    return name, {"repeat": repeat,
+                  "min_ms": min(times),
+                  "median_ms": statistics.median(times),
+                  "mean_ms": statistics.mean(times),
+                  "max_ms": max(times)}
+
+def run_benchmarks(menus, args):
+
+    results = {}
+    menu = menus[0]
+
+    name, result = measure("mc_draw_plan_build",
+                           lambda: core.mc_draw_plan_build(menu.mc_properties, menu.mc_sections), args.repeat)
+    results[name] = result
+    name, result = measure("mc_property_indices_build",
+                           lambda: core.mc_property_indices_build(menu.mc_properties), args.repeat)
+    results[name] = result
+
+    # Property move to the top and the bottom of its section, alternately
+    if len(menu.mc_properties) > 0:
+        positions = itertools.cycle(["TOP", "BOTTOM"])
+        def move():
+            plan = core.mc_draw_plan_build(menu.mc_properties, menu.mc_sections)
+            rows = next(rows for sec_index, rows, empty, hidden in plan if menu.mc_sections[sec_index].name == "Section 0")
+            position = core.mc_order_position(rows, [0], next(positions))
+            core.mc_order_move(menu.mc_properties, rows, [0], position, "mc_id")
+        name, result = measure("mc_order_move", move, args.repeat)
+        results[name] = result
+
+    # Link graph of all the menus
+    groups = generate_link_groups(menus)
+    name, result = measure("mc_links_order",
+                           lambda: core.mc_links_order(groups), args.repeat)
+    results[name] = result
+
+    # Mapping of the links of a property
+    links = [l for prop in menu.mc_properties for l in prop.linked_props if l.map_enable]
+    if len(links) > 0:
+        mapping = core.MCLinkMap(links, links)
+        values = itertools.cycle([0.25, 0.5, 0.75])
+        name, result = measure("MCLinkMap.evaluate",
+                               lambda: mapping.evaluate(next(values)), args.repeat)
+        results[name] = result
+
+    # Outfit mask map of all the outfit objects against the mask modifiers of the body
+    outfits = ["Bench_Cloth_" + str(c) + "_" + str(o) for c in range(args.collections) for o in range(args.outfits)]
+    for mode, modifiers in (("CONTAINS", ["Mask " + o for o in outfits]),
+                            ("PREFIX", [o + " Mask" for o in outfits]),
+                            ("EXACT", outfits)):
+        name, result = measure("mc_mask_map_build (" + mode + ")",
+                               lambda: core.mc_mask_map_build(outfits, modifiers, mode), args.repeat)
+        results[name] = result
+
+    return results
+
+
+def main():
+
+    args = parse_args()
+
+    start = time.perf_counter()
+    menus = [generate_menu(i, args) for i in range(args.menus)]
+    generation = (time.perf_counter() - start) * 1000.
+    results = run_benchmarks(menus, args)
+
+    output = {"python": sys.version.split()[0],
+              "numpy": core.numpy is not None,
+              "backend": "python",
+              "parameters": {"menus": args.menus,
+                             "props": args.props,
+                             "links": args.links,
+                             "collections": args.collections,
+                             "outfits": args.outfits},
+              "generation_ms": generation,
+              "results": results}
+
+    if args.output != "":
+        with open(args.output, 'w') as file:
+            json.dump(output, file, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+if __name__ == "__main__":
+    main()
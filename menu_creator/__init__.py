@@ -0,0 +1,4078 @@
+# Mustard Menu Creator addon
+# https://github.com/Mustard2/MenuCreator
+
+bl_info = {
+    "name": "Menu Creator",
+    "description": "Create a custom menu for each Object. To add properties or collections, just right click on the properties and hit Add property to the Menu",
+    "author": "Mustard",
+    "version": (0, 0, 3),
+    "blender": (2, 91, 0),
+    "warning": "",
+    "wiki_url": "https://github.com/Mustard2/MenuCreator",
+    "category": "User Interface",
+}
+
+import bpy
+import addon_utils
+import sys
+import os
+import re
+import ast
+import heapq
+import time
+import math
+import json
+import csv
+import functools
+from collections import OrderedDict, deque
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from bpy.types import Header, Menu, Panel
+from bpy.props import *
+from bpy.app.handlers import persistent
+from mathutils import Vector, Color
+import webbrowser
+from .core import (mc_draw_plan_build,
+                   mc_property_indices_build,
+                   mc_section_indices_build,
+                   mc_order_keys_between,
+                   mc_order_move,
+                   mc_order_position,
+                   mc_value_copy,
+                   mc_path_quote,
+                   mc_path_join,
+                   mc_signatures_compatible,
+                   MCLinkMap,
+                   mc_links_order,
+                   mc_mask_map_build,
+                   mc_bitset_encode,
+                   mc_bitset_decode)
+
+# CLASSES
+
+# Arrays for ENUM properties
+# Array to store different section type
+mc_section_type_list = [
+                ("DEFAULT","Standard","A simple collection of properties that can be added right clicking on fields -> Add Property to the Menu"),
+                ("COLLECTION","Collection List","Right clicking on them in the Outliner, you can add collections whose elements can be shown/hidden in the Menu. Only one collection will be shown at the same time.\nIdeal for: Outfit lists","OUTLINER_COLLECTION",1)
+            ]
+# Array to store the ways the mask modifiers of the outfit body are assigned to the outfit objects
+mc_outfit_mask_mode_list = [
+                ("CONTAINS","Name Contains","The mask modifier name contains the object name.\nIf more object names are found, the longest one is used"),
+                ("PREFIX","Name Prefix","The mask modifier name starts with the object name.\nIf more object names are found, the longest one is used"),
+                ("EXACT","Exact Name","The mask modifier is called as the object"),
+                ("POINTER","Manual","Only the masks manually assigned to the objects are used")
+            ]
+# Array to store the kinds of properties that can be added all at once
+mc_add_all_type_list = [
+                ("CUSTOM_OBJECT","Object Custom Properties","All the custom properties of the Object","OBJECT_DATA",0),
+                ("CUSTOM_DATA","Data Custom Properties","All the custom properties of the Object Data (Mesh, Armature, ...)","MESH_DATA",1),
+                ("SHAPE_KEYS","Shape Keys","All the shape keys values of the Object","SHAPEKEY_DATA",2),
+                ("MODIFIERS","Modifiers Visibility","All the modifiers viewport visibility toggles of the Object","MODIFIER",3)
+            ]
+# Array to store the possible positions when moving properties and sections
+mc_order_position_list = [
+                ("UP","Up","Move up by one position"),
+                ("DOWN","Down","Move down by one position"),
+                ("TOP","Top","Move to the top"),
+                ("BOTTOM","Bottom","Move to the bottom"),
+                ("INDEX","Index","Move to the given position")
+            ]
+# Array to store possible icons to be used by properties and sections
+mc_icon_list = [
+                ("NONE","No Icon","No Icon"),
+                ("USER", "Face", "Face","USER",1),
+                ("HAIR", "Hair", "Hair","HAIR",2),
+                ("MOD_CLOTH", "Cloth", "Cloth","MOD_CLOTH",3),
+                ("MATERIAL", "Material", "Material","MATERIAL",4),
+                ("ARMATURE_DATA", "Armature", "Armature","ARMATURE_DATA",5),
+                ("MOD_ARMATURE", "Armature", "Armature","MOD_ARMATURE",6),
+                ("EXPERIMENTAL", "Experimental", "Experimental","EXPERIMENTAL",7),
+                ("WORLD", "World", "World","WORLD",8),
+                ("PARTICLEMODE", "Comb", "Comb","PARTICLEMODE",9)
+            ]
+
+# Class with all the settings variables
+class MC_Settings(bpy.types.PropertyGroup):
+    
+    # Update functions for settings
+    # Function to avoid edit mode and fixed object while exiting edit mode
+    def mc_ms_editmode_update(self, context):
+    
+        if not self.ms_editmode:
+            for obj in mc_registry_objects():
+                obj.mc_edit_enable = False
+    
+        return
+    
+    # Function to save the fixed object pointer to be used until the object is released
+    def mc_em_fixobj_update(self, context):
+    
+        if self.em_fixobj:
+            self.em_fixobj_pointer = context.active_object
+    
+        return
+    
+    # Function to enable or disable the profiling
+    def mc_ms_profile_update(self, context):
+        global mc_profiling
+        
+        mc_profiling = self.ms_profile
+        
+        return
+    
+    # Main Settings definitions
+    ms_editmode: bpy.props.BoolProperty(name="Enable Edit Mode Tools",
+                                        description="Unlock tools to customize the menu.\nDisable when the Menu is complete",
+                                        default=False,
+                                        update = mc_ms_editmode_update)
+    ms_advanced: bpy.props.BoolProperty(name="Advanced Options",
+                                        description="Unlock advanced options",
+                                        default=False)
+    ms_debug: bpy.props.BoolProperty(name="Debug mode",
+                                        description="Unlock debug mode.\nMore messaged will be generated in the console.\nEnable it only if you encounter problems, as it might degrade general Blender performance",
+                                        default=False)
+    ms_profile: bpy.props.BoolProperty(name="Profiling",
+                                        description="Record timings and call counts of the handlers, the panel and the operators, and the hit rates of the caches.\nThe statistics are shown in the Settings panel and can be exported",
+                                        default=False,
+                                        update = mc_ms_profile_update)
+    
+    # Menu Specific properties
+    mss_name: bpy.props.StringProperty(name="Name",
+                                        description="Name of the menu.\nChoose the name of the menu to be shown before the properties",
+                                        default="Object: ")
+    mss_obj_name: bpy.props.BoolProperty(name="Show the Object Name",
+                                        description="Show the Object name after the Name.\nFor instance, if the Name is \"Object: \", the shown name will be \"Object: name_of_object\"",
+                                        default=True)
+    
+    # Edit mode properties
+    em_fixobj: bpy.props.BoolProperty(name="Pin Object",
+                                        description="Pin the Object you are using to edit the menu.\nThe object you pin will be considered as the target of all properties addition, and only this Object menu will be shown",
+                                        default=False,
+                                        update = mc_em_fixobj_update)
+    em_fixobj_pointer : bpy.props.PointerProperty(type=bpy.types.Object)
+
+bpy.utils.register_class(MC_Settings)
+bpy.types.Scene.mc_settings = bpy.props.PointerProperty(type=MC_Settings)
+
+# Object specific properties
+bpy.types.Object.mc_enable = bpy.props.BoolProperty(name="", default=False)
+bpy.types.Object.mc_link_drivers = bpy.props.BoolProperty(name="Links as Drivers", default=False, description="The linked properties of this menu are synced by drivers")
+bpy.types.Object.mc_edit_enable = bpy.props.BoolProperty(name="Edit Mode", default=False, description="Enable edit mode in this menu.\nActivating this option you will have access to various tools to modify properties and sections")
+
+# Class to store collections for section informations
+class MCCollectionItem(bpy.types.PropertyGroup):
+    collection : bpy.props.PointerProperty(name="Collection",type=bpy.types.Collection)
+
+bpy.utils.register_class(MCCollectionItem)
+
+# Function to clear the cached outfit mask maps when a manual assignment is changed
+def mc_outfit_mask_update(self, context):
+    
+    mc_mask_maps.clear()
+
+# Class to store the mask modifiers of the outfit body manually assigned to outfit objects
+class MCOutfitMaskItem(bpy.types.PropertyGroup):
+    object : bpy.props.PointerProperty(name="Object", type=bpy.types.Object, update=mc_outfit_mask_update)
+    modifier : bpy.props.StringProperty(name="Mask", description="Name of the mask modifier of the outfit body", update=mc_outfit_mask_update)
+
+bpy.utils.register_class(MCOutfitMaskItem)
+
+# Class to store the objects of an outfit preset
+class MCOutfitPresetObjectItem(bpy.types.PropertyGroup):
+    object : bpy.props.PointerProperty(name="Object", type=bpy.types.Object)
+
+bpy.utils.register_class(MCOutfitPresetObjectItem)
+
+# Class to store outfit presets: the visibility of the objects is stored as a hexadecimal bitset,
+# with one bit for each of the objects, in the same order
+class MCOutfitPresetItem(bpy.types.PropertyGroup):
+    name : bpy.props.StringProperty(name="Name")
+    objects : bpy.props.CollectionProperty(name="Objects", type=MCOutfitPresetObjectItem)
+    bits : bpy.props.StringProperty(name="Visibility")
+
+bpy.utils.register_class(MCOutfitPresetItem)
+
+# Class to store section informations
+class MCSectionItem(bpy.types.PropertyGroup):
+    
+    # Properties and update functions
+    # Function to update the collapsed status if the collapsed section property is changed
+    def mc_sections_collapsed_update(self, context):
+    
+        if not self.collapsable:
+            self.collapsed = False
+        
+        return
+    
+    # Function to create an array of tuples for enum collections
+    def mc_collections_list(self, context):
+        
+        items = []
+        
+        for el in self.collections:
+            if hasattr(el.collection, 'name'):
+                items.append( (el.collection.name,el.collection.name,el.collection.name) )
+            
+        return sorted(items)
+
+    # Function to update global collection properties
+    # Only the previously active and the newly active collections are changed, unless they are not in the state
+    # this section left them (e.g. after switching view layer, or editing them in the Outliner)
+    def mc_collections_list_update(self, context):
+        
+        view_layer = context.view_layer
+        active = bpy.data.collections.get(self.collections_list)
+        previous = self.collections_previous
+        if (active is None or previous is None or not any(el.collection == previous for el in self.collections)
+                or not mc_collection_list_check(self, view_layer, previous, True)
+                or (previous != active and not mc_collection_list_check(self, view_layer, active, False))):
+            mc_collections_list_apply(self, view_layer)
+            return
+        
+        if previous != active:
+            mc_collection_list_set(self, view_layer, previous, False)
+        mc_collection_list_set(self, view_layer, active, True)
+        self.collections_previous = active
+    
+    # Function to update all the collections when the way of hiding them is changed
+    def mc_collections_exclude_update(self, context):
+        
+        mc_collections_list_apply(self, context.view_layer, reset=True)
+
+    def mc_collections_global_options_update(self, context):
+        
+        items = []
+        
+        i = 0
+        for el in self.collections:
+            for obj in el.collection.objects:
+                
+                if obj.type == "MESH":
+                    obj.data.use_auto_smooth = self.collections_global_normalautosmooth
+                
+                for modifier in obj.modifiers:
+                    if modifier.type == "CORRECTIVE_SMOOTH":
+                        modifier.show_viewport = self.collections_global_smoothcorrection
+                        modifier.show_render = self.collections_global_smoothcorrection
+                    elif modifier.type == "MASK":
+                        modifier.show_viewport = self.collections_global_mask
+                        modifier.show_render = self.collections_global_mask
+                    elif modifier.type == "SHRINKWRAP":
+                        modifier.show_viewport = self.collections_global_shrinkwrap
+                        modifier.show_render = self.collections_global_shrinkwrap
+        
+        if self.outfit_enable and self.outfit_body is not None:
+            if not self.collections_global_mask:
+                for modifier in self.outfit_body.modifiers:
+                    if modifier.type == "MASK":
+                        modifier.show_viewport = False
+                        modifier.show_render = False
+            else:
+                mask_map = mc_outfit_mask_map(self)
+                for el in self.collections:
+                    for obj in el.collection.objects:
+                        if not obj.hide_viewport:
+                            for modifier in mc_outfit_masks(self, mask_map, obj.name):
+                                modifier.show_viewport = True
+                                modifier.show_render = True
+            
+        return
+    
+    # Poll function for the selection of mesh only in pointer properties
+    def mc_poll_mesh(self, object):
+        return object.type == 'MESH'
+    
+    
+    # Global section options
+    id : bpy.props.IntProperty(name="Section ID")
+    name : bpy.props.StringProperty(name="Section Name")
+    icon : bpy.props.StringProperty(name="Section Icon", default="")
+    type : bpy.props.StringProperty(name="Section Type", default="DEFAULT")
+    collapsable : bpy.props.BoolProperty(name="Section Collapsable", default=False, update=mc_sections_collapsed_update)
+    
+    # Global section option enforcer
+    collapsed : bpy.props.BoolProperty(name="", default = False, description="")
+    
+    # COLLECTION type options
+    collections_enable_global_smoothcorrection: bpy.props.BoolProperty(default=False)
+    collections_enable_global_shrinkwrap: bpy.props.BoolProperty(default=False)
+    collections_enable_global_mask: bpy.props.BoolProperty(default=False)
+    collections_enable_global_normalautosmooth: bpy.props.BoolProperty(default=False)
+    # COLLECTION type data
+    collections: bpy.props.CollectionProperty(name="Section Collection List", type=MCCollectionItem)
+    collections_list: bpy.props.EnumProperty(name="Section Collection List", items = mc_collections_list, update=mc_collections_list_update)
+    collections_previous: bpy.props.PointerProperty(name="Previous Collection", type=bpy.types.Collection)
+    collections_exclude: bpy.props.BoolProperty(name="Exclude from View Layer", default=False, update=mc_collections_exclude_update, description="Exclude the inactive collections from the View Layer instead of hiding them.\nExcluded collections are removed from the scene evaluation, saving memory with many heavy collections")
+    collections_global_smoothcorrection: bpy.props.BoolProperty(name="Smooth Correction", default=True, update=mc_collections_global_options_update)
+    collections_global_shrinkwrap: bpy.props.BoolProperty(name="Shrinkwrap", default=True, update=mc_collections_global_options_update)
+    collections_global_mask: bpy.props.BoolProperty(name="Mask", default=True, update=mc_collections_global_options_update)
+    collections_global_normalautosmooth: bpy.props.BoolProperty(name="Normals Auto Smooth", default=True, update=mc_collections_global_options_update)
+    # Outfit variant
+    outfit_enable : bpy.props.BoolProperty(name="Outfit", default=False)
+    outfit_body : bpy.props.PointerProperty(name="Outfit Body", description = "The masks of this object will be switched on/off depending on which elements of the collections visibility", type=bpy.types.Object, poll=mc_poll_mesh)
+    outfit_mask_mode : bpy.props.EnumProperty(name="Masks", default="CONTAINS", items=mc_outfit_mask_mode_list, description="Choose how the mask modifiers of the Body are assigned to the objects of the collections")
+    outfit_masks : bpy.props.CollectionProperty(name="Outfit Masks", type=MCOutfitMaskItem)
+    outfit_presets : bpy.props.CollectionProperty(name="Outfit Presets", type=MCOutfitPresetItem)
+
+bpy.utils.register_class(MCSectionItem)
+bpy.types.Object.mc_sections = bpy.props.CollectionProperty(type=MCSectionItem)
+
+# Function to update the links when a mapping option is changed
+# The mapped values are written again, even if the source value did not change
+def mc_link_map_update(self, context):
+    
+    if isinstance(self, MCMapPointItem):
+        # Curve points are stored in the linked property item
+        link_prop = self.id_data.path_resolve(self.path_from_id().rsplit('.map_points', 1)[0])
+    else:
+        link_prop = self
+    mc_link_resync(link_prop)
+    
+    return
+
+# Class to store the points of the remap curve of a linked property
+class MCMapPointItem(bpy.types.PropertyGroup):
+    x : bpy.props.FloatProperty(name="Input", default=0., update=mc_link_map_update)
+    y : bpy.props.FloatProperty(name="Output", default=0., update=mc_link_map_update)
+
+bpy.utils.register_class(MCMapPointItem)
+
+# Class to store linked properties informations
+class MCLinkedPropertyItem(bpy.types.PropertyGroup):
+    
+    # Function to update the links when the mapping is enabled or disabled
+    # Mapped links can not use drivers, so they are synced by the handlers
+    def mc_link_map_enable_update(self, context):
+        
+        obj = self.id_data
+        if obj.mc_link_drivers:
+            for prop in obj.mc_properties:
+                if prop.link_bidirectional or not any(l == self for l in prop.linked_props):
+                    continue
+                if self.map_enable:
+                    mc_link_driver_remove(self)
+                else:
+                    mc_link_driver_add(prop, self)
+        mc_link_resync(self)
+        
+        return
+    
+    path: bpy.props.StringProperty(name="Property Path")
+    id : bpy.props.StringProperty(name="Property Identifier")
+    data_id : bpy.props.PointerProperty(name="Property ID", type=bpy.types.ID)
+    data_path : bpy.props.StringProperty(name="Property Relative Path")
+    # Mapping of the value written to the linked property
+    map_enable : bpy.props.BoolProperty(name="Mapping", default=False, update=mc_link_map_enable_update, description="Map the value before writing it to the linked property.\nMapping is ignored for bidirectional links")
+    map_factor : bpy.props.FloatProperty(name="Factor", default=1., update=mc_link_map_update)
+    map_offset : bpy.props.FloatProperty(name="Offset", default=0., update=mc_link_map_update)
+    map_clamp : bpy.props.BoolProperty(name="Clamp", default=False, update=mc_link_map_update)
+    map_min : bpy.props.FloatProperty(name="Min", default=0., update=mc_link_map_update)
+    map_max : bpy.props.FloatProperty(name="Max", default=1., update=mc_link_map_update)
+    map_invert : bpy.props.BoolProperty(name="Invert", default=False, update=mc_link_map_update, description="Invert boolean values")
+    map_curve : bpy.props.BoolProperty(name="Curve", default=False, update=mc_link_map_update, description="Remap the value with a curve, linearly interpolated between its points, before applying factor and offset")
+    map_points : bpy.props.CollectionProperty(name="Curve Points", type=MCMapPointItem)
+
+bpy.utils.register_class(MCLinkedPropertyItem)
+
+# Class to store properties informations
+class MCPropertyItem(bpy.types.PropertyGroup):
+    
+    # Function to update the menu cached data when the property is hidden
+    def mc_prop_hide_update(self, context):
+        
+        mc_menu_changed(self.id_data)
+        
+        return
+    
+    # Function to update the links when the sync direction is changed
+    # Bidirectional links can not use drivers, since drivers make the linked properties read-only
+    def mc_prop_bidirectional_update(self, context):
+        
+        if self.id_data.mc_link_drivers:
+            for link_prop in self.linked_props:
+                if self.link_bidirectional:
+                    mc_link_driver_remove(link_prop)
+                else:
+                    mc_link_driver_add(self, link_prop)
+        mc_links_invalidate()
+        
+        return
+    
+    mc_id : bpy.props.IntProperty(name="Section ID")
+    name : bpy.props.StringProperty(name="Property Name")
+    path: bpy.props.StringProperty(name="Property Path")
+    id : bpy.props.StringProperty(name="Property Identifier")
+    data_id : bpy.props.PointerProperty(name="Property ID", type=bpy.types.ID)
+    data_path : bpy.props.StringProperty(name="Property Relative Path")
+    icon : bpy.props.EnumProperty(name="Property Icon", default="NONE",items=mc_icon_list)
+    section : bpy.props.StringProperty(name="Section", default="Unsorted")
+    hide : bpy.props.BoolProperty(name="Hide Property", default=False, update=mc_prop_hide_update)
+    select : bpy.props.BoolProperty(name="Select", default=False, description="Select the property.\nSelected properties of the same section are moved together")
+    
+    linked_props: bpy.props.CollectionProperty(name="Linked properties", type=MCLinkedPropertyItem)
+    link_bidirectional : bpy.props.BoolProperty(name="Bidirectional Links", default=False, update=mc_prop_bidirectional_update, description="Sync the property and the linked properties in both directions.\nThe last edited property is written to the others")
+
+bpy.utils.register_class(MCPropertyItem)
+bpy.types.Object.mc_properties = bpy.props.CollectionProperty(type=MCPropertyItem)
+
+
+
+# MENU OBJECTS REGISTRY
+
+# Objects with an initialized menu: object pointer -> object name
+# Objects are looked up by name, so that no reference to removed objects is kept
+mc_registry = {}
+# Number of objects in the file during the last registry check, -1 if the registry needs to be rebuilt
+mc_registry_objects_count = -1
+
+# Function to rebuild the registry scanning all the objects in the file
+# If the objects with a menu changed (e.g. duplicated or appended menus), the links and the menu caches are
+# invalidated, so that the new menus are compiled and synced
+# Return the list of objects with an initialized menu
+def mc_registry_rebuild():
+    global mc_registry_objects_count
+    
+    previous = set(mc_registry)
+    mc_registry.clear()
+    objects = []
+    for obj in bpy.data.objects:
+        if obj.mc_enable:
+            mc_registry[obj.as_pointer()] = obj.name
+            objects.append(obj)
+    mc_registry_objects_count = len(bpy.data.objects)
+    
+    if set(mc_registry) != previous:
+        mc_menu_caches_clear()
+        mc_links_invalidate()
+    
+    return objects
+
+# Function to invalidate the registry, which will be rebuilt at the next access
+def mc_registry_clear():
+    global mc_registry_objects_count
+    
+    mc_registry.clear()
+    mc_registry_objects_count = -1
+
+# Function to add an object to the registry
+def mc_registry_add(obj):
+    mc_registry[obj.as_pointer()] = obj.name
+
+# Function to remove an object from the registry
+def mc_registry_remove(obj):
+    mc_registry.pop(obj.as_pointer(), None)
+
+# Function to get the list of objects with an initialized menu
+def mc_registry_objects():
+    global mc_registry_objects_count
+    
+    # New objects might have been appended or duplicated from objects with a menu
+    if mc_registry_objects_count < 0 or len(bpy.data.objects) > mc_registry_objects_count:
+        return mc_registry_rebuild()
+    mc_registry_objects_count = len(bpy.data.objects)
+    
+    objects = []
+    for ptr, name in mc_registry.items():
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.as_pointer() != ptr or not obj.mc_enable:
+            # The object has been renamed or removed
+            return mc_registry_rebuild()
+        objects.append(obj)
+    
+    return objects
+
+
+# PROFILING
+
+# If True, timings and cache hits are recorded. Mirrors the ms_profile setting, to be checked without context
+mc_profiling = False
+# Number of recent calls used for the rolling average
+mc_stats_window = 100
+# Maximum number of timings shown in the Settings panel
+mc_stats_draw_max = 20
+# Timings: name -> MCStat
+mc_stats = {}
+# Cache lookups: name -> [hits, misses]
+mc_cache_stats = {}
+
+# Class to store the timings of a function
+class MCStat:
+    
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.
+        self.max = 0.
+        self.recent = deque(maxlen=mc_stats_window)
+    
+    def add(self, elapsed):
+        self.calls = self.calls + 1
+        self.total = self.total + elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.recent.append(elapsed)
+    
+    # Rolling average of the last calls
+    def rolling(self):
+        return sum(self.recent) / len(self.recent) if len(self.recent) > 0 else 0.
+
+# Function to record the time spent in a function, in seconds
+def mc_stats_record(name, elapsed):
+    stat = mc_stats.get(name)
+    if stat is None:
+        stat = mc_stats[name] = MCStat()
+    stat.add(elapsed)
+
+# Function to record a cache lookup
+def mc_cache_record(name, hit):
+    counts = mc_cache_stats.setdefault(name, [0, 0])
+    counts[0 if hit else 1] += 1
+
+# Function to clear the recorded statistics
+def mc_stats_clear():
+    mc_stats.clear()
+    mc_cache_stats.clear()
+
+# Decorator to record the timings of a function while profiling
+def mc_profiled(name):
+    
+    def decorator(function):
+        
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not mc_profiling:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                mc_stats_record(name, time.perf_counter() - start)
+        
+        wrapper.mc_profiled = True
+        return wrapper
+    
+    return decorator
+
+# Function to get the recorded statistics as rows, with times in milliseconds
+# Return the timing rows, sorted by total time, and the cache rows
+def mc_stats_rows():
+    
+    timings = []
+    for name, stat in mc_stats.items():
+        timings.append({"name": name,
+                        "calls": stat.calls,
+                        "total_ms": stat.total * 1000.,
+                        "avg_ms": stat.total * 1000. / stat.calls,
+                        "max_ms": stat.max * 1000.,
+                        "rolling_ms": stat.rolling() * 1000.})
+    timings.sort(key=lambda x: x["total_ms"], reverse=True)
+    
+    caches = []
+    for name, counts in mc_cache_stats.items():
+        caches.append({"name": name,
+                       "hits": counts[0],
+                       "misses": counts[1],
+                       "hit_rate": counts[0] / (counts[0] + counts[1])})
+    caches.sort(key=lambda x: x["name"])
+    
+    return timings, caches
+
+
+# MENU CACHES
+
+# Version of each menu, increased every time its properties or sections are modified: object pointer -> version
+mc_menu_versions = {}
+# Cached draw plans: object pointer -> (version, plan)
+mc_draw_plans = {}
+# Cached property indices: object pointer -> (version, length, {(path, id): index}, {section name: [indices]}, max mc_id)
+mc_property_indices = {}
+# Cached section indices: object pointer -> (version, length, {name: index}, {id: index}, max id)
+mc_section_indices = {}
+# Cached type signatures: object pointer -> (version, length, {(path, id): signature}, {signature: [indices]})
+mc_signature_indices = {}
+
+# Function to get the current version of a menu
+def mc_menu_version(obj):
+    return mc_menu_versions.get(obj.as_pointer(), 0)
+
+# Function to be called every time the properties or the sections of a menu are modified
+def mc_menu_changed(obj):
+    key = obj.as_pointer()
+    mc_menu_versions[key] = mc_menu_versions.get(key, 0) + 1
+
+# Function to clean all the cached menu data (needed after undo and file load)
+def mc_menu_caches_clear():
+    mc_mask_maps.clear()
+    mc_menu_versions.clear()
+    mc_draw_plans.clear()
+    mc_property_indices.clear()
+    mc_section_indices.clear()
+    mc_signature_indices.clear()
+
+# Function to get the draw plan of a menu
+# The plan is a list of (section index, property indices, empty, hidden) in the order the sections are drawn
+# The property indices are sorted by mc_id. A section is hidden if all its properties are hidden
+def mc_draw_plan(obj):
+    
+    key = obj.as_pointer()
+    version = mc_menu_version(obj)
+    cached = mc_draw_plans.get(key)
+    hit = cached is not None and cached[0] == version
+    if mc_profiling:
+        mc_cache_record("Draw plans", hit)
+    if hit:
+        return cached[1]
+    
+    plan = mc_draw_plan_build(obj.mc_properties, obj.mc_sections)
+    mc_draw_plans[key] = (version, plan)
+    
+    return plan
+
+# Function to get the cached property indices of a menu
+def mc_property_indices_get(obj):
+    
+    key = obj.as_pointer()
+    version = mc_menu_version(obj)
+    cached = mc_property_indices.get(key)
+    hit = cached is not None and cached[0] == version and cached[1] == len(obj.mc_properties)
+    if mc_profiling:
+        mc_cache_record("Property indices", hit)
+    if hit:
+        return cached
+    
+    cached = (version, len(obj.mc_properties)) + mc_property_indices_build(obj.mc_properties)
+    mc_property_indices[key] = cached
+    
+    return cached
+
+# Function to get the index of the properties of a menu: (path, id) -> index in mc_properties
+def mc_property_index(obj):
+    return mc_property_indices_get(obj)[2]
+
+# Function to get the indices of the properties in a section
+def mc_section_property_indices(obj, name):
+    return mc_property_indices_get(obj)[3].get(name, [])
+
+# Function to get the cached type signatures of the properties of a menu
+# Properties that can not be resolved have no signature
+def mc_signature_indices_get(obj):
+    
+    key = obj.as_pointer()
+    version = mc_menu_version(obj)
+    cached = mc_signature_indices.get(key)
+    hit = cached is not None and cached[0] == version and cached[1] == len(obj.mc_properties)
+    if mc_profiling:
+        mc_cache_record("Type signatures", hit)
+    if hit:
+        return cached
+    
+    by_prop = {}
+    by_signature = {}
+    i = 0
+    for el in obj.mc_properties:
+        accessor = mc_resolve_accessor(el)
+        signature = mc_accessor_signature(accessor) if accessor is not None else None
+        if signature is not None:
+            by_prop[(el.path, el.id)] = signature
+            by_signature.setdefault(signature, []).append(i)
+        i = i + 1
+    
+    cached = (version, len(obj.mc_properties), by_prop, by_signature)
+    mc_signature_indices[key] = cached
+    
+    return cached
+
+# Function to get the type signature of a property of a menu
+def mc_property_signature(obj, item):
+    return mc_signature_indices_get(obj)[2].get((item[1], item[2]))
+
+# Function to get the cached section indices of a menu
+def mc_section_indices_get(obj):
+    
+    key = obj.as_pointer()
+    version = mc_menu_version(obj)
+    cached = mc_section_indices.get(key)
+    hit = cached is not None and cached[0] == version and cached[1] == len(obj.mc_sections)
+    if mc_profiling:
+        mc_cache_record("Section indices", hit)
+    if hit:
+        return cached
+    
+    cached = (version, len(obj.mc_sections)) + mc_section_indices_build(obj.mc_sections)
+    mc_section_indices[key] = cached
+    
+    return cached
+
+# ---- Outfit masks
+
+# Cached outfit mask maps: (object pointer, section name) -> (stamp, {object name: [modifier names]})
+# The stamp only contains counts and pointers, so that it is cheap to check at every click: objects and masks
+# added or removed change the counts, while renames and assignment changes clear the cache
+# Renames done from Python and objects swapped between collections are not seen: they are found by
+# mc_outfit_masks, which rebuilds the map once when it does not match the objects and the masks
+mc_mask_maps = {}
+
+# Function to get the map of the outfit objects of a section to the mask modifiers of its outfit body
+# Every object of the section has an entry, also if no mask is assigned to it
+# If rebuild is True, the map is built again even if the cached one looks valid
+def mc_outfit_mask_map(sec, rebuild=False):
+    
+    body = sec.outfit_body
+    if body is None:
+        return {}
+    
+    collections = tuple((el.collection.as_pointer(), len(el.collection.objects)) for el in sec.collections if el.collection is not None)
+    stamp = (body.as_pointer(), sec.outfit_mask_mode, len(body.modifiers), collections, len(sec.outfit_masks))
+    
+    key = (sec.id_data.as_pointer(), sec.name)
+    cached = mc_mask_maps.get(key)
+    hit = cached is not None and cached[0] == stamp and not rebuild
+    if mc_profiling:
+        mc_cache_record("Outfit masks", hit)
+    if hit:
+        return cached[1]
+    
+    objects = tuple(obj.name for el in sec.collections if el.collection is not None for obj in el.collection.objects)
+    modifiers = tuple(m.name for m in body.modifiers if m.type == "MASK")
+    assignments = tuple((el.object.name, el.modifier) for el in sec.outfit_masks if el.object is not None)
+    mask_map = mc_mask_map_build(objects, modifiers, sec.outfit_mask_mode, assignments)
+    for name in objects:
+        mask_map.setdefault(name, [])
+    mc_mask_maps[key] = (stamp, mask_map)
+    
+    return mask_map
+
+# Owner of the message bus subscriptions
+mc_msgbus_owner = object()
+
+# Function to clear the cached outfit mask maps when an object or a mask modifier is renamed
+def mc_mask_maps_rename():
+    
+    mc_mask_maps.clear()
+
+# Function to subscribe to the renames of objects and mask modifiers
+# The subscriptions are removed when a file is loaded, so they are added again by the load handler
+def mc_msgbus_subscribe():
+    
+    bpy.msgbus.clear_by_owner(mc_msgbus_owner)
+    for key in ((bpy.types.Object, "name"), (bpy.types.MaskModifier, "name")):
+        bpy.msgbus.subscribe_rna(key=key, owner=mc_msgbus_owner, args=(), notify=mc_mask_maps_rename)
+
+# Function to get the mask modifiers of the outfit body of a section assigned to an object
+# If the object is not in the map, or one of its masks is not found, the map is stale: it is rebuilt once
+def mc_outfit_masks(sec, mask_map, name):
+    
+    modifiers = sec.outfit_body.modifiers
+    names = mask_map.get(name)
+    if names is None or not all(m in modifiers for m in names):
+        cached = mc_mask_maps.get((sec.id_data.as_pointer(), sec.name))
+        if cached is None or cached[1] is mask_map:
+            mask_map = mc_outfit_mask_map(sec, rebuild=True)
+        else:
+            # Already rebuilt for another object
+            mask_map = cached[1]
+        names = mask_map.get(name, ())
+    
+    return [modifiers[m] for m in names if m in modifiers]
+
+# Function to get the objects listed in a collection section, without repetitions
+def mc_outfit_objects(sec):
+    
+    objects = []
+    found = set()
+    for el in sec.collections:
+        if el.collection is None:
+            continue
+        for obj in el.collection.objects:
+            if obj.name not in found:
+                found.add(obj.name)
+                objects.append(obj)
+    
+    return objects
+
+# Function to set the visibility of the objects of a collection section, and the masks of the outfit body
+# visibility: list of (object, visible). Only the values that change are written
+def mc_outfit_apply(sec, visibility):
+    
+    for obj, visible in visibility:
+        if obj.hide_viewport == visible:
+            obj.hide_viewport = not visible
+        if obj.hide_render == visible:
+            obj.hide_render = not visible
+    
+    if sec.outfit_enable and sec.outfit_body is not None and sec.collections_global_mask:
+        mask_map = mc_outfit_mask_map(sec)
+        for obj, visible in visibility:
+            for modifier in mc_outfit_masks(sec, mask_map, obj.name):
+                if modifier.show_viewport != visible:
+                    modifier.show_viewport = visible
+                if modifier.show_render != visible:
+                    modifier.show_render = visible
+
+# ---- Collection lists
+
+# Function to find the layer collections of a collection in a layer collection tree
+def mc_layer_collections(layer_collection, collection):
+    
+    found = []
+    for child in layer_collection.children:
+        if child.collection == collection:
+            found.append(child)
+        found.extend(mc_layer_collections(child, collection))
+    
+    return found
+
+# Function to show or hide a collection of a Collection List section, only changing the values that differ
+# Inactive collections are hidden, or excluded from the view layer if collections_exclude is enabled
+# If reset is True, the state used by the other option is also restored
+def mc_collection_list_set(sec, view_layer, collection, visible, reset=False):
+    
+    hide = not visible and not sec.collections_exclude
+    if collection.hide_viewport != hide:
+        collection.hide_viewport = hide
+    if collection.hide_render != hide:
+        collection.hide_render = hide
+    
+    if sec.collections_exclude or reset:
+        exclude = not visible and sec.collections_exclude
+        for layer_collection in mc_layer_collections(view_layer.layer_collection, collection):
+            if layer_collection.exclude != exclude:
+                layer_collection.exclude = exclude
+
+# Function to check if a collection of a Collection List section is shown or hidden as set by the section
+def mc_collection_list_check(sec, view_layer, collection, visible):
+    
+    hide = not visible and not sec.collections_exclude
+    if collection.hide_viewport != hide or collection.hide_render != hide:
+        return False
+    
+    if sec.collections_exclude:
+        for layer_collection in mc_layer_collections(view_layer.layer_collection, collection):
+            if layer_collection.exclude == visible:
+                return False
+    
+    return True
+
+# Function to update all the collections of a Collection List section
+def mc_collections_list_apply(sec, view_layer, reset=False):
+    
+    active = None
+    for el in sec.collections:
+        if el.collection is None:
+            continue
+        visible = el.collection.name == sec.collections_list
+        if visible:
+            active = el.collection
+        mc_collection_list_set(sec, view_layer, el.collection, visible, reset)
+    
+    sec.collections_previous = active
+
+
+# COLLECTION MANAGEMENT FUNCTIONS
+
+# ---- Properties only functions
+
+# Function to remove a specific property from the collection
+# Return 1 if the property was found and deleted
+def mc_remove_property_item(collection, item):
+    i = mc_find_index(collection, item)
+    if i>=0:
+        collection.remove(i)
+        mc_menu_changed(collection.id_data)
+    
+    return i>=0
+
+# Function to add a specific property to the collection, if not already there
+# Return 0 if the property has not been added because already in the properties list
+def mc_add_property_item(collection, item):
+    return mc_add_property_items(collection, [item]) > 0
+
+# Function to add a list of properties to the collection, skipping the ones already in the properties list
+# items is a list of [name, path, id] or [name, path, id, data_id, data_path]. Return the number of properties added
+def mc_add_property_items(collection, items, section="Unsorted"):
+    
+    obj = collection.id_data
+    cached = mc_property_indices_get(obj)
+    index = cached[2]
+    
+    new_items = []
+    for item in items:
+        key = (item[1], item[2])
+        if key not in index:
+            index[key] = -1
+            new_items.append(item)
+    
+    if len(new_items) == 0:
+        return 0
+    
+    # New properties are added at the bottom
+    keys = mc_order_keys_between(cached[4], None, len(new_items))
+    if keys is None:
+        keys = [cached[4] + i + 1 for i in range(len(new_items))]
+    
+    rows = cached[3].setdefault(section, [])
+    for item, mc_id in zip(new_items, keys):
+        add_item = collection.add()
+        add_item.name = item[0]
+        add_item.path = item[1]
+        add_item.id = item[2]
+        if len(item) > 3:
+            add_item.data_id = item[3]
+            add_item.data_path = item[4]
+        add_item.section = section
+        add_item.mc_id = mc_id
+        index[(item[1], item[2])] = len(collection) - 1
+        rows.append(len(collection) - 1)
+    
+    # The property index is updated in place, as adding properties does not change the other indices
+    mc_menu_changed(obj)
+    mc_property_indices[obj.as_pointer()] = (mc_menu_version(obj), len(collection), index, cached[3], keys[-1])
+    
+    return len(new_items)
+
+# Function to get the path of an ID, in the form bpy.data.objects["name"]
+def mc_id_path(id):
+    # The representation of IDs is bpy.data.collection['name']
+    return repr(id).split('[', 1)[0] + '[' + mc_path_quote(id.name) + ']'
+
+# Function to get the full path of a property owner from its ID and its path relative to the ID
+def mc_ref_path(data_id, data_path):
+    if data_path == "":
+        return mc_id_path(data_id)
+    return mc_id_path(data_id) + '.' + data_path
+
+# Regular expression to split a full path in the ID collection, the ID name and the path relative to the ID
+mc_path_re = re.compile(r'^bpy\.data\.(\w+)\[(\'|")((?:\\.|(?!\2).)*)\2\]\.?(.*)$')
+
+# Function to split a full path (e.g. bpy.data.objects["Body"].data) in the ID and the path relative to it
+# Return (None, "") if the path does not start from an ID
+def mc_split_path(path):
+    
+    match = mc_path_re.match(path)
+    if match is None:
+        return None, ""
+    collection = getattr(bpy.data, match.group(1), None)
+    if collection is None or not hasattr(collection, 'get'):
+        return None, ""
+    
+    return collection.get(ast.literal_eval(match.group(2) + match.group(3) + match.group(2))), match.group(4)
+
+# Function to get the [name, path, id, data_id, data_path] of a property from its owner and its identifier
+# For custom properties the identifier is the name of the property
+# Return None if the owner can not be reached from an ID
+def mc_property_item(owner, identifier, name=None):
+    
+    id_data = owner.id_data
+    if id_data is None:
+        return None
+    try:
+        path = owner.path_from_id()
+    except ValueError:
+        return None
+    
+    # Embedded IDs (e.g. material node trees) are referenced through their owner ID
+    if getattr(id_data, 'is_embedded_data', False):
+        data_id, data_path = mc_split_path(repr(id_data))
+        if data_id is None:
+            return None
+        if path != "":
+            data_path = data_path + '.' + path if data_path != "" else path
+    else:
+        data_id = id_data
+        data_path = path
+    
+    rna_property = owner.bl_rna.properties.get(identifier)
+    if rna_property is None:
+        id = '[' + mc_path_quote(identifier) + ']'
+        if name is None:
+            name = identifier
+    else:
+        id = identifier
+        if name is None:
+            name = rna_property.name
+    
+    return [name, mc_ref_path(data_id, data_path), id, data_id, data_path]
+
+# Function to add properties to the menu of an object, to be used also from scripts
+# properties is a list of (owner, identifier), where identifier is the name of the property in the owner
+# Return the number of properties added
+def mc_add_properties(obj, properties, section="Unsorted"):
+    
+    items = []
+    for el in properties:
+        item = mc_property_item(el[0], el[1])
+        if item is not None:
+            items.append(item)
+    
+    return mc_add_property_items(obj.mc_properties, items, section)
+
+# Function to list the custom properties of an ID that can be shown in the menu
+def mc_custom_property_items(id):
+    
+    items = []
+    rna_properties = id.bl_rna.properties
+    for key in id.keys():
+        # Skip internal data and properties registered by addons
+        if key.startswith('_') or key in rna_properties:
+            continue
+        value = id[key]
+        if isinstance(value, (int, float, str)) or hasattr(value, 'to_list'):
+            item = mc_property_item(id, key, key)
+            if item is not None:
+                items.append(item)
+    
+    return items
+
+# Function to list the shape keys values of an object
+# The reference shape key is not listed
+def mc_shape_key_items(obj):
+    
+    items = []
+    shape_keys = getattr(obj.data, 'shape_keys', None)
+    if shape_keys is None:
+        return items
+    
+    for key_block in shape_keys.key_blocks:
+        if key_block == shape_keys.reference_key:
+            continue
+        item = mc_property_item(key_block, 'value', key_block.name)
+        if item is not None:
+            items.append(item)
+    
+    return items
+
+# Function to list the modifiers visibility toggles of an object
+def mc_modifier_toggle_items(obj, render=False):
+    
+    items = []
+    for modifier in obj.modifiers:
+        item = mc_property_item(modifier, 'show_viewport', modifier.name)
+        if item is not None:
+            items.append(item)
+        if render:
+            item = mc_property_item(modifier, 'show_render', modifier.name + ' (Render)')
+            if item is not None:
+                items.append(item)
+    
+    return items
+
+# Function to set the structured reference of a property or linked property item
+# Old menus only store the full path: the ID and the relative path are extracted from it
+# Return True if the item has been changed
+def mc_migrate_item(item):
+    
+    if item.data_id is None:
+        if item.path == "":
+            return False
+        data_id, data_path = mc_split_path(item.path)
+        if data_id is None:
+            return False
+        item.data_id = data_id
+        item.data_path = data_path
+        return True
+    
+    # Update the full path if the ID has been renamed
+    path = mc_ref_path(item.data_id, item.data_path)
+    if path != item.path:
+        item.path = path
+        return True
+    
+    return False
+
+# Function to migrate an item, skipping the items that can not be edited (e.g. in library overrides)
+# Return True if the item has been changed
+def mc_migrate_item_safe(item):
+    
+    try:
+        return mc_migrate_item(item)
+    except AttributeError:
+        return False
+
+# Function to migrate all the menus to structured references
+# Menus of linked objects can not be edited, and keep being resolved from their full paths
+def mc_migrate_menus():
+    
+    for obj in mc_registry_objects():
+        if obj.library is not None:
+            continue
+        changed = False
+        for prop in obj.mc_properties:
+            if mc_migrate_item_safe(prop):
+                changed = True
+            for link_prop in prop.linked_props:
+                if mc_migrate_item_safe(link_prop):
+                    changed = True
+        if changed:
+            mc_menu_changed(obj)
+            mc_links_invalidate()
+
+# Function to find the index of a property
+# Return -1 if the property is not in the collection
+def mc_find_index(collection, item):
+    
+    obj = collection.id_data
+    i = mc_property_index(obj).get((item[1], item[2]), -1)
+    
+    # Rebuild the index if the collection has been changed without updating the menu version
+    if i>=0 and (collection[i].path != item[1] or collection[i].id != item[2]):
+        mc_menu_changed(obj)
+        i = mc_property_index(obj).get((item[1], item[2]), -1)
+    
+    return i
+
+# Function to clean properties of a single object
+def mc_clean_single_properties(obj):
+    obj.mc_properties.clear()
+    mc_menu_changed(obj)
+
+# Function to clean all the properties of every object
+def mc_clean_properties():
+    for obj in mc_registry_objects():
+        obj.mc_properties.clear()
+        mc_menu_changed(obj)
+
+# Function to print the properties
+def mc_print_properties():
+    for obj in mc_registry_objects():
+        for el in obj.mc_properties:
+            print(el.id + " : property" + el.name + " with path "+el.path)
+
+# Function to iutput the ID of the element
+def mc_prop_ID(elem):
+    return elem.mc_id
+
+# ---- Sections only functions
+
+# Function to create an array of tuples for enum properties
+def mc_section_list(scene, context):
+    
+    settings = bpy.context.scene.mc_settings
+    if settings.em_fixobj:
+        obj = settings.em_fixobj_pointer
+    else:
+        obj = context.active_object
+    
+    items = []
+    
+    i = 0
+    for el in obj.mc_sections:
+        if el.type == "DEFAULT":
+            items.append( (el.name,el.name,el.name,el.icon,i) )
+            i = i + 1
+        
+    return items
+
+# Function to clean sections of a single object
+def mc_clean_single_sections(obj):
+    obj.mc_sections.clear()
+    mc_menu_changed(obj)
+    
+# Function to clean the sections of every object
+def mc_clean_sections():
+    for obj in mc_registry_objects():
+        obj.mc_sections.clear()
+        mc_menu_changed(obj)
+
+# Function to find the index of a section from the name
+# Return -1 if the section is not in the collection
+def mc_find_index_section(collection, item):
+    
+    obj = collection.id_data
+    i = mc_section_indices_get(obj)[2].get(item, -1)
+    
+    # Rebuild the index if the collection has been changed without updating the menu version
+    if i>=0 and collection[i].name != item:
+        mc_menu_changed(obj)
+        i = mc_section_indices_get(obj)[2].get(item, -1)
+    
+    return i
+
+# Function to find the index of a section from the ID
+# Return -1 if the section is not in the collection
+def mc_find_index_section_fromID(collection, item):
+    
+    obj = collection.id_data
+    i = mc_section_indices_get(obj)[3].get(item, -1)
+    
+    # Rebuild the index if the collection has been changed without updating the menu version
+    if i>=0 and collection[i].id != item:
+        mc_menu_changed(obj)
+        i = mc_section_indices_get(obj)[3].get(item, -1)
+    
+    return i
+
+# Function to iutput the ID of the element
+def mc_sec_ID(elem):
+    return elem.id
+
+# ---- Sections and properties functions
+
+# Function to find the length of a collection
+def mc_len_collection(collection):
+    i=0
+    for el in collection:
+        i=i+1
+    return i
+
+# ---- Ordering functions
+# Properties (mc_id) and sections (id) are ordered by sparse ordering ids, see core.py
+
+# Function to get the indices of the properties in a section, sorted by mc_id
+def mc_section_rows(obj, name):
+    
+    sections = obj.mc_sections
+    for sec_index, sec_rows, sec_empty, sec_hidden in mc_draw_plan(obj):
+        if sections[sec_index].name == name:
+            return sec_rows
+    
+    props = obj.mc_properties
+    return sorted(mc_section_property_indices(obj, name), key = lambda k: (props[k].mc_id, k))
+
+# Function to move properties of the same section to a new position in the section
+# indices: indices in mc_properties of the properties to move
+# position: the new position, counted in the section without the moved properties
+def mc_move_properties(obj, section, indices, position):
+    
+    mc_order_move(obj.mc_properties, list(mc_section_rows(obj, section)), indices, position, "mc_id")
+    mc_menu_changed(obj)
+
+# Function to get the indices of the sections that can be moved, sorted by id
+# The Unsorted section is always the first one and it can not be moved
+def mc_section_order(obj):
+    
+    sections = obj.mc_sections
+    return [plan[0] for plan in mc_draw_plan(obj) if sections[plan[0]].name != "Unsorted"]
+
+# Function to move a section to a new position
+# position: the new position, counted without the moved section and the Unsorted section
+def mc_move_section(obj, index, position):
+    
+    sections = obj.mc_sections
+    unsorted = mc_find_index_section(sections, "Unsorted")
+    minimum = sections[unsorted].id if unsorted>=0 else None
+    
+    mc_order_move(sections, mc_section_order(obj), [index], position, "id", minimum)
+    mc_menu_changed(obj)
+
+# Function to move a property to a new position in its section
+# If the property is selected, all the selected properties of the section are moved together
+def mc_move_property(obj, i, position, index=0):
+    
+    props = obj.mc_properties
+    rows = mc_section_rows(obj, props[i].section)
+    if props[i].select:
+        moved = [k for k in rows if props[k].select]
+    else:
+        moved = [i]
+    
+    new_position = mc_order_position(rows, moved, position, index)
+    if new_position is not None:
+        mc_move_properties(obj, props[i].section, moved, new_position)
+
+# Function to move a section to a new position
+def mc_move_section_to(obj, index, position, new_index=0):
+    
+    order = mc_section_order(obj)
+    if index not in order:
+        return
+    
+    new_position = mc_order_position(order, [index], position, new_index)
+    if new_position is not None:
+        mc_move_section(obj, index, new_position)
+
+
+
+# LINKED PROPERTIES SYNC ENGINE
+
+# Cache of the resolved accessors, indexed by (path, id)
+# The least recently used accessors are removed when the cache is full
+mc_accessor_cache = OrderedDict()
+mc_accessor_cache_size = 4096
+# Compiled link groups, one for each property with linked properties, in topological order
+mc_link_groups = []
+# Cycles found in the link graph, as lists of property names
+mc_link_cycles = []
+# Minimum number of targets in the same collection to write them with a single foreach_set
+mc_batch_min = 8
+# Path of an item of a collection, relative to its ID (e.g. key_blocks["Smile"] or modifiers[2])
+mc_batch_re = re.compile(r'^(.+)\[(\d+|".*"|\'.*\')\]$')
+# Reverse dependency index: pointer of the source ID -> link groups reading from it
+mc_link_sources = {}
+# If True, the link groups will be compiled again before the next sync
+mc_links_dirty = True
+# Identities of the properties whose link groups are written again at the next sync, even if the source value
+# did not change (e.g. after the mapping of a linked property has been edited)
+mc_links_resync = set()
+# Link groups synced at every frame during playback and rendering, None if they need to be computed
+mc_animated_groups = None
+# True while a render is running
+mc_rendering = False
+
+# Class to access a property, resolved once from its path and identifier
+class MCAccessor:
+    
+    def __init__(self, owner, id, data_id=None):
+        self.owner = owner
+        # Custom properties are stored as ["name"], all the other properties as attributes
+        if id.startswith('['):
+            self.key = ast.literal_eval(id[1:-1])
+            self.attr = None
+        else:
+            self.key = None
+            self.attr = id
+        # The ID the property is referenced from, and the ID owning the property
+        self.data_id = data_id if data_id is not None else owner.id_data
+        self.id_data = owner.id_data
+        # Key identifying the property, shared by all the accessors to the same property
+        self.identity = (owner.as_pointer(), id if self.attr is not None else repr(self.key))
+        # Path of the owner from its ID and pointer of the owner. Structs inside an ID (modifiers, shape keys,
+        # bones, ...) are freed without invalidating the Python reference, so they are resolved again to check them
+        try:
+            self.owner_path = owner.path_from_id()
+        except ValueError:
+            self.owner_path = ""
+        self.pointer = owner.as_pointer()
+    
+    # Check that the IDs have not been removed, and that the owner is still the struct found at its path
+    # Renamed IDs are still valid
+    def valid(self):
+        try:
+            self.data_id.name
+            self.id_data.name
+        except ReferenceError:
+            return False
+        if self.owner_path == "":
+            return True
+        try:
+            return self.id_data.path_resolve(self.owner_path).as_pointer() == self.pointer
+        except (ValueError, AttributeError):
+            return False
+    
+    def get(self):
+        if self.attr is None:
+            return mc_value_copy(self.owner[self.key])
+        return mc_value_copy(getattr(self.owner, self.attr))
+    
+    def set(self, value):
+        if self.attr is None:
+            self.owner[self.key] = value
+        else:
+            setattr(self.owner, self.attr, value)
+
+# Class to write the same attribute of many items of a collection with a single foreach_get and foreach_set
+# NumPy buffers are used when available
+class MCBatch:
+    
+    def __init__(self, collection, attr, indices, value, id_data):
+        self.collection = collection
+        self.attr = attr
+        self.indices = indices
+        # Array length of the attribute, 0 for single values, and type of the values
+        self.size = len(value) if isinstance(value, tuple) else 0
+        self.type = type(value[0] if self.size > 0 else value)
+        self.id_data = id_data
+        # The indices are valid as long as the number of items does not change and the batched items are still
+        # at the same indices: reordering modifiers or shape keys keeps the length, so the items are also compared
+        self.length = len(collection)
+        self.pointers = [collection[i].as_pointer() for i in indices]
+    
+    def valid(self):
+        try:
+            self.id_data.name
+        except ReferenceError:
+            return False
+        if len(self.collection) != self.length:
+            return False
+        collection = self.collection
+        return all(collection[i].as_pointer() == p for i, p in zip(self.indices, self.pointers))
+    
+    # Write the value to all the items in the batch which have a different value
+    def write(self, value):
+        
+        width = max(self.size, 1)
+        if numpy is not None:
+            buffer = numpy.empty(self.length * width, dtype=numpy.float32 if self.type == float else numpy.int32)
+            self.collection.foreach_get(self.attr, buffer)
+            if self.size > 0:
+                buffer = buffer.reshape(self.length, width)
+            indices = numpy.array(self.indices)
+            if not (buffer[indices] != numpy.asarray(value, dtype=buffer.dtype)).any():
+                return
+            buffer[indices] = value
+            self.collection.foreach_set(self.attr, buffer.ravel())
+            return
+        
+        buffer = [self.type()] * (self.length * width)
+        self.collection.foreach_get(self.attr, buffer)
+        written = False
+        for i in self.indices:
+            if self.size == 0:
+                if buffer[i] != value:
+                    buffer[i] = value
+                    written = True
+            elif tuple(buffer[i * width:(i + 1) * width]) != value:
+                buffer[i * width:(i + 1) * width] = value
+                written = True
+        if written:
+            self.collection.foreach_set(self.attr, buffer)
+
+# Function to split the targets of a link group in single targets and batches
+# Targets which are items of the same collection are batched when they are at least mc_batch_min
+def mc_link_batches(targets):
+    
+    items = {}
+    singles = []
+    for target in targets:
+        item = None
+        if target.attr is not None:
+            try:
+                match = mc_batch_re.match(target.owner.path_from_id())
+            except ValueError:
+                match = None
+            if match is not None:
+                collection = target.id_data.path_resolve(match.group(1))
+                if hasattr(collection, 'foreach_set'):
+                    key = match.group(2)
+                    index = int(key) if key.isdigit() else collection.find(ast.literal_eval(key))
+                    if index >= 0 and collection[index] == target.owner:
+                        item = (target.id_data.as_pointer(), match.group(1), target.attr), collection, index
+        if item is None:
+            singles.append(target)
+        else:
+            items.setdefault(item[0], []).append((target, item[1], item[2]))
+    
+    batches = []
+    for entries in items.values():
+        if len(entries) < mc_batch_min:
+            singles.extend(e[0] for e in entries)
+            continue
+        target, collection, index = entries[0]
+        batches.append(MCBatch(collection, target.attr, sorted(set(e[2] for e in entries)), target.get(), target.id_data))
+    
+    return singles, batches
+
+# Class to store a source property and all the properties linked to it
+# In bidirectional groups every member can be edited: the first member found changed is written to the others
+class MCLinkGroup:
+    
+    def __init__(self, source, targets, name="", bidirectional=False):
+        self.source = source
+        self.targets = targets
+        self.name = name
+        self.bidirectional = bidirectional
+        # Last value written to the targets
+        self.value = None
+        # Position in the topological order, and groups reading from the targets of this group
+        self.rank = 0
+        self.downstream = []
+        # Properties read and written by the group
+        self.members = [source] + targets
+        self.inputs = self.members if bidirectional else [source]
+        self.outputs = self.members if bidirectional else targets
+        # Targets written one by one, batches of targets in the same collection, and mapped targets
+        self.singles = targets
+        self.batches = []
+        self.mapping = None
+        # Members of bidirectional groups indexed by the key of their ID, to check only the updated ones
+        self.members_by_key = {}
+        if bidirectional:
+            for member in self.members:
+                self.members_by_key.setdefault(mc_id_key(member.id_data), []).append(member)
+    
+    # Write the source value to the targets, only if it changed since the last sync
+    # If the keys of the changed IDs are given, only the members of bidirectional groups in them are checked
+    # Return True if the source value changed
+    def sync(self, changed=None):
+        
+        if not all(m.valid() for m in self.members) or not all(b.valid() for b in self.batches):
+            raise ReferenceError("Menu Creator - Linked property has been renamed or removed")
+        
+        if not self.bidirectional or self.value is None:
+            value = self.source.get()
+        else:
+            value = self.changed_value(changed)
+        if value == self.value:
+            return False
+        
+        for target in self.members if self.bidirectional else self.singles:
+            if target.get() != value:
+                target.set(value)
+        for batch in self.batches:
+            batch.write(value)
+        if self.mapping is not None:
+            for target, mapped in zip(self.mapping.targets, self.mapping.evaluate(value)):
+                if target.get() != mapped:
+                    target.set(mapped)
+        self.value = value
+        
+        return True
+    
+    # Find the value of the first member changed since the last sync
+    # Return the last synced value if no member changed
+    def changed_value(self, changed):
+        
+        if changed is None:
+            candidates = self.members
+        elif len(changed) < len(self.members_by_key):
+            candidates = [m for key in changed for m in self.members_by_key.get(key, ())]
+        else:
+            candidates = [m for key, members in self.members_by_key.items() if key in changed for m in members]
+        
+        for member in candidates:
+            value = member.get()
+            if value != self.value:
+                return value
+        
+        return self.value
+
+# Function to resolve a property or linked property item to an accessor
+# Return None if the property can not be found
+def mc_resolve_accessor(item):
+    
+    key = (item.path, item.id)
+    data_id = item.data_id
+    accessor = mc_accessor_cache.get(key)
+    hit = accessor is not None and accessor.valid() and (data_id is None or accessor.data_id == data_id)
+    if mc_profiling:
+        mc_cache_record("Accessors", hit)
+    if hit:
+        mc_accessor_cache.move_to_end(key)
+        return accessor
+    
+    # The owner of a cached accessor has been removed (e.g. a modifier or a shape key deleted before the panel
+    # is drawn again): the stale accessor is dropped, and the link groups sharing it are compiled again
+    if accessor is not None:
+        mc_accessor_cache.pop(key, None)
+        mc_links_invalidate()
+    
+    try:
+        if data_id is not None:
+            owner = data_id.path_resolve(item.data_path) if item.data_path != "" else data_id
+        else:
+            # Items not migrated to structured references
+            owner = eval(item.path)
+        accessor = MCAccessor(owner, item.id, data_id)
+        accessor.get()
+    except Exception:
+        if bpy.context.scene.mc_settings.ms_debug:
+            print('MenuCreator - Property \'' + item.path + '.' + item.id + '\' could not be resolved.')
+        mc_accessor_cache.pop(key, None)
+        return None
+    
+    mc_accessor_cache[key] = accessor
+    mc_accessor_cache.move_to_end(key)
+    if len(mc_accessor_cache) > mc_accessor_cache_size:
+        mc_accessor_cache.popitem(last=False)
+    
+    return accessor
+
+# Function to compute the type signature of a property: (type, array length, subtype, enum items)
+# Custom properties have no RNA definition, so their signature is computed from their value
+# Return None if the property can not be linked
+def mc_rna_signature(owner, id):
+    
+    if id.startswith('['):
+        value = owner[ast.literal_eval(id[1:-1])]
+        if isinstance(value, str):
+            return ("STRING", 0, "NONE", ())
+        elif isinstance(value, int):
+            return ("INT", 0, "NONE", ())
+        elif isinstance(value, float):
+            return ("FLOAT", 0, "NONE", ())
+        elif hasattr(value, 'to_list'):
+            value = value.to_list()
+            return ("FLOAT" if any(isinstance(v, float) for v in value) else "INT", len(value), "NONE", ())
+        return None
+    
+    prop = owner.bl_rna.properties.get(id)
+    if prop is None or prop.type in {"POINTER", "COLLECTION"}:
+        return None
+    
+    items = ()
+    if prop.type == "ENUM":
+        items = tuple(item.identifier for item in prop.enum_items)
+    
+    return (prop.type, getattr(prop, 'array_length', 0), prop.subtype, items)
+
+# Function to compute the type signature of a property from its accessor
+def mc_accessor_signature(accessor):
+    
+    if accessor.attr is None:
+        return mc_rna_signature(accessor.owner, '[' + repr(accessor.key) + ']')
+    return mc_rna_signature(accessor.owner, accessor.attr)
+
+# Function to get the key used in the dependency index for an ID
+# Evaluated IDs coming from the depsgraph are mapped to their original
+def mc_id_key(id):
+    return id.original.as_pointer()
+
+# Function to collect the keys of the IDs updated in the depsgraph
+# Object updates also include their data and shape keys, material updates their node tree
+def mc_depsgraph_changed_ids(depsgraph):
+    
+    changed = set()
+    for update in depsgraph.updates:
+        id = update.id.original
+        changed.add(id.as_pointer())
+        if isinstance(id, bpy.types.Object):
+            if id.data is not None:
+                changed.add(id.data.as_pointer())
+                if getattr(id.data, 'shape_keys', None) is not None:
+                    changed.add(id.data.shape_keys.as_pointer())
+        elif isinstance(id, bpy.types.Material):
+            if id.node_tree is not None:
+                changed.add(id.node_tree.as_pointer())
+    
+    return changed
+
+# Function to invalidate the link groups, to be called when properties or links are added or removed
+def mc_links_invalidate(clear_cache=False):
+    global mc_links_dirty
+    mc_links_dirty = True
+    if clear_cache:
+        mc_accessor_cache.clear()
+
+# Function to write the linked properties of a linked property item again at the next sync
+def mc_link_resync(link_prop):
+    
+    accessor = mc_resolve_accessor(link_prop)
+    if accessor is not None:
+        mc_links_resync.add(accessor.identity)
+    mc_links_invalidate()
+
+# Function to compile the link groups of all the objects
+def mc_links_compile():
+    global mc_link_groups, mc_link_sources, mc_links_dirty
+    
+    # Keep the last synced values of the groups with the same members, so that unchanged sources are not
+    # written again. Groups with new or removed members start without a value, so all their targets are written
+    old_values = {}
+    for group in mc_link_groups:
+        old_values[tuple(m.identity for m in group.members)] = group.value
+    
+    groups = []
+    sources = {}
+    for obj in mc_registry_objects():
+        if mc_profiling:
+            start = time.perf_counter()
+        for prop in obj.mc_properties:
+            if len(prop.linked_props) == 0:
+                continue
+            source = mc_resolve_accessor(prop)
+            if source is None:
+                continue
+            targets = []
+            exact = []
+            mapped = []
+            mapped_items = []
+            for link_prop in prop.linked_props:
+                target = mc_resolve_accessor(link_prop)
+                # Properties already synced by a driver are skipped
+                if target is None or mc_accessor_driven(target):
+                    continue
+                targets.append(target)
+                if link_prop.map_enable and not prop.link_bidirectional:
+                    mapped.append(target)
+                    mapped_items.append(link_prop)
+                else:
+                    exact.append(target)
+            if len(targets) > 0:
+                group = MCLinkGroup(source, targets, obj.name + ": " + prop.name, prop.link_bidirectional)
+                if any(m.identity in mc_links_resync for m in group.members):
+                    group.value = None
+                else:
+                    group.value = old_values.get(tuple(m.identity for m in group.members))
+                if not group.bidirectional:
+                    group.singles, group.batches = mc_link_batches(exact)
+                    if len(mapped) > 0:
+                        group.mapping = MCLinkMap(mapped, mapped_items)
+                groups.append(group)
+                for key in set(mc_id_key(m.id_data) for m in group.inputs):
+                    sources.setdefault(key, []).append(group)
+        if mc_profiling:
+            mc_stats_record("Links compile: " + obj.name, time.perf_counter() - start)
+    
+    mc_link_groups = mc_links_sort(groups)
+    mc_link_sources = sources
+    mc_links_resync.clear()
+    mc_links_dirty = False
+
+# Function to sort the link groups in topological order, so that a chain of links is synced in one pass
+# Groups in cycles are placed last and reported
+def mc_links_sort(groups):
+    global mc_link_cycles
+    
+    order, cycles = mc_links_order(groups)
+    
+    cycles = [[g.name for g in cycle] for cycle in cycles]
+    if cycles != mc_link_cycles:
+        for cycle in cycles:
+            print('MenuCreator - Link cycle detected: ' + ' -> '.join(cycle + cycle[:1]))
+    mc_link_cycles = cycles
+    
+    return order
+
+# Function to sync the linked properties
+# If the keys of the changed IDs are given, only the links reading from them, and the links downstream of
+# the written ones, are synced
+# The groups are synced in topological order, at most once each, so that the links reach a fixed point in one
+# call even when the graph has cycles
+def mc_links_sync(changed=None):
+    
+    if mc_links_dirty:
+        mc_links_compile()
+    
+    if changed is None:
+        heap = [(g.rank, g) for g in mc_link_groups]
+    else:
+        groups = set()
+        for key in changed:
+            groups.update(mc_link_sources.get(key, ()))
+        heap = [(g.rank, g) for g in groups]
+    mc_links_propagate(heap, changed)
+
+# Function to sync a heap of (rank, group), adding the downstream groups of the groups that changed
+# The keys of the changed IDs are used for the groups initially in the heap, the downstream groups check
+# all their members
+def mc_links_propagate(heap, changed=None):
+    
+    heapq.heapify(heap)
+    queued = set(g for r, g in heap)
+    initial = set(queued)
+    synced = set()
+    
+    while len(heap) > 0:
+        rank, group = heapq.heappop(heap)
+        if group in synced:
+            continue
+        synced.add(group)
+        try:
+            if mc_profiling:
+                start = time.perf_counter()
+                written = group.sync(changed if group in initial else None)
+                mc_stats_record("Link: " + group.name, time.perf_counter() - start)
+            else:
+                written = group.sync(changed if group in initial else None)
+        except ReferenceError:
+            # Some property has been renamed or removed: resolve everything again at the next sync
+            mc_links_invalidate(clear_cache=True)
+            break
+        if written:
+            for reader in group.downstream:
+                if reader not in queued:
+                    queued.add(reader)
+                    heapq.heappush(heap, (reader.rank, reader))
+
+# ---- Playback and rendering
+# During playback and rendering the depsgraph handler is skipped, and the links are synced once per frame
+# Only the links whose sources are animated, directly or through other links, can change during playback
+
+# Function to check if the animation is playing in any window
+def mc_animation_playing():
+    
+    for window in bpy.context.window_manager.windows:
+        if window.screen.is_animation_playing:
+            return True
+    
+    return False
+
+# Function to collect the link groups whose sources are animated
+def mc_links_animated():
+    
+    if mc_links_dirty:
+        mc_links_compile()
+    
+    groups = set(g for g in mc_link_groups if any(mc_accessor_animated(i) for i in g.inputs))
+    
+    # Groups reading from properties written by animated groups are animated too
+    stack = list(groups)
+    while len(stack) > 0:
+        for reader in stack.pop().downstream:
+            if reader not in groups:
+                groups.add(reader)
+                stack.append(reader)
+    
+    return sorted(groups, key=lambda g: g.rank)
+
+# Function to sync the links with animated sources
+def mc_links_sync_animated():
+    global mc_animated_groups
+    
+    if mc_links_dirty or mc_animated_groups is None:
+        mc_animated_groups = mc_links_animated()
+    
+    mc_links_propagate([(g.rank, g) for g in mc_animated_groups])
+    if mc_links_dirty:
+        mc_animated_groups = None
+
+# ---- Drivers
+# Links can be compiled to native drivers on the linked properties, so that they are synced by Blender
+# without any Python code running in the handlers
+
+# Types of IDs that can be used as driver targets, indexed by the name of their bpy.data collection
+mc_id_types = {
+                "actions": "ACTION",
+                "armatures": "ARMATURE",
+                "cameras": "CAMERA",
+                "collections": "COLLECTION",
+                "curves": "CURVE",
+                "images": "IMAGE",
+                "lattices": "LATTICE",
+                "lights": "LIGHT",
+                "materials": "MATERIAL",
+                "meshes": "MESH",
+                "metaballs": "META",
+                "node_groups": "NODETREE",
+                "objects": "OBJECT",
+                "particles": "PARTICLE",
+                "scenes": "SCENE",
+                "shape_keys": "KEY",
+                "speakers": "SPEAKER",
+                "textures": "TEXTURE",
+                "worlds": "WORLD"
+            }
+
+# Function to get the driver target type of an ID
+# Return None if the ID can not be used as driver target
+def mc_id_type(id):
+    return mc_id_types.get(repr(id).split('[', 1)[0].rsplit('.', 1)[-1])
+
+# Function to get the path of a property relative to its ID, as used by drivers and fcurves
+def mc_item_data_path(item):
+    return mc_path_join(item.data_path, item.id)
+
+# Function to get the path of the property of an accessor relative to the ID owning it
+# Return None if the path can not be computed
+def mc_accessor_path(accessor):
+    
+    try:
+        path = accessor.owner.path_from_id()
+    except ValueError:
+        return None
+    if accessor.attr is None:
+        return mc_path_join(path, '[' + mc_path_quote(accessor.key) + ']')
+    return mc_path_join(path, accessor.attr)
+
+# Function to check if the property of an accessor is driven
+def mc_accessor_driven(accessor):
+    
+    animation_data = accessor.id_data.animation_data
+    if animation_data is None or len(animation_data.drivers) == 0:
+        return False
+    
+    path = mc_accessor_path(accessor)
+    if path is None:
+        return False
+    
+    return animation_data.drivers.find(path) is not None
+
+# Function to check if any element of a property is in a collection of fcurves
+# Each element of an array property has its own fcurve, so all the indices are checked
+def mc_fcurves_find(fcurves, path, length):
+    
+    for index in range(max(length, 1)):
+        if fcurves.find(path, index=index) is not None:
+            return True
+    
+    return False
+
+# Function to check if the property of an accessor is animated, by fcurves or drivers
+# IDs with NLA tracks are considered animated, since the strips can animate any property
+def mc_accessor_animated(accessor):
+    
+    animation_data = accessor.id_data.animation_data
+    if animation_data is None:
+        return False
+    if len(animation_data.nla_tracks) > 0:
+        return True
+    
+    path = mc_accessor_path(accessor)
+    if path is None:
+        return False
+    
+    value = accessor.get()
+    length = len(value) if isinstance(value, tuple) else 0
+    if animation_data.action is not None and mc_fcurves_find(animation_data.action.fcurves, path, length):
+        return True
+    return mc_fcurves_find(animation_data.drivers, path, length)
+
+# Name of the variable of the drivers created for the links, used to recognize them
+mc_link_driver_variable = "mc_link_value"
+
+# Function to get the driver fcurves of the property of an accessor, one for each array element
+def mc_accessor_drivers(accessor):
+    
+    animation_data = accessor.id_data.animation_data
+    if animation_data is None:
+        return []
+    
+    path = mc_accessor_path(accessor)
+    if path is None:
+        return []
+    
+    return [fcurve for fcurve in animation_data.drivers if fcurve.data_path == path]
+
+# Function to check if a driver fcurve has been created by Menu Creator for a link
+def mc_link_driver_owned(fcurve):
+    
+    variables = fcurve.driver.variables
+    return len(variables) == 1 and variables[0].name == mc_link_driver_variable
+
+# Function to add a driver to a linked property, reading the value of the menu property
+# Properties already driven by drivers not created for the links are skipped
+# Return True if the driver has been added
+def mc_link_driver_add(prop, link_prop):
+    
+    # Mapped links are synced by the handlers
+    if link_prop.map_enable:
+        return False
+    
+    target = mc_resolve_accessor(link_prop)
+    if target is None or prop.data_id is None:
+        return False
+    id_type = mc_id_type(prop.data_id)
+    if id_type is None:
+        return False
+    if not all(mc_link_driver_owned(f) for f in mc_accessor_drivers(target)):
+        return False
+    
+    try:
+        fcurves = target.owner.driver_add(link_prop.id)
+    except TypeError:
+        # Properties that can not be animated
+        return False
+    
+    source_path = mc_item_data_path(prop)
+    is_array = isinstance(fcurves, list)
+    if not is_array:
+        fcurves = [fcurves]
+    
+    i = 0
+    for fcurve in fcurves:
+        driver = fcurve.driver
+        driver.type = 'AVERAGE'
+        for var in list(driver.variables):
+            driver.variables.remove(var)
+        var = driver.variables.new()
+        var.name = mc_link_driver_variable
+        var.type = 'SINGLE_PROP'
+        var.targets[0].id_type = id_type
+        var.targets[0].id = prop.data_id
+        var.targets[0].data_path = source_path + ('[' + str(i) + ']' if is_array else '')
+        i = i + 1
+    
+    return True
+
+# Function to remove the driver of a linked property
+# Only the drivers created for the links are removed
+# Return True if a driver has been removed
+def mc_link_driver_remove(link_prop):
+    
+    target = mc_resolve_accessor(link_prop)
+    if target is None:
+        return False
+    
+    drivers = [f for f in mc_accessor_drivers(target) if mc_link_driver_owned(f)]
+    for fcurve in drivers:
+        target.id_data.animation_data.drivers.remove(fcurve)
+    
+    return len(drivers) > 0
+
+# Function to add or remove the drivers for all the links of a menu
+# Return the number of drivers added or removed
+def mc_link_drivers(obj, enable):
+    
+    count = 0
+    for prop in obj.mc_properties:
+        for link_prop in prop.linked_props:
+            if enable:
+                if prop.link_bidirectional:
+                    continue
+                if mc_link_driver_add(prop, link_prop):
+                    count = count + 1
+            elif mc_link_driver_remove(link_prop):
+                count = count + 1
+    
+    obj.mc_link_drivers = enable
+    mc_links_invalidate()
+    
+    return count
+
+
+
+
+# OPERATORS
+
+# Right click functions and operators
+def dump(obj, text):
+    print('-'*40, text, '-'*40)
+    for attr in dir(obj):
+        if hasattr( obj, attr ):
+            print( "obj.%s = %s" % (attr, getattr(obj, attr)))
+
+# Operator to add the right click button on properties
+class MC_AddProperty(bpy.types.Operator):
+    """Add the property to the menu"""
+    bl_idname = "mc.add_property"
+    bl_label = "Add property to Menu"
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        if hasattr(context, 'button_prop') and hasattr(context, 'button_pointer'):
+            prop = context.button_prop
+            
+            item = mc_property_item(context.button_pointer, prop.identifier, prop.name)
+            if item is None:
+                self.report({'WARNING'}, 'Menu Creator - Invalid selection.')
+                return {'FINISHED'}
+            
+            if obj.mc_enable:
+            
+                if mc_add_property_item(obj.mc_properties, item):
+                    self.report({'INFO'}, 'Menu Creator - Property added to the \'' + obj.name + '\' menu.')
+                else:
+                    self.report({'WARNING'}, 'Menu Creator - Property of \'' + obj.name + '\' was already added.')
+            
+            else:
+                self.report({'ERROR'}, 'Menu Creator - Can not add property \'' + obj.name + '\'. No menu has been initialized.')
+
+        #if hasattr(context, 'button_operator'):
+        #    op = context.button_operator
+        #    dump(op, 'button_operator')     
+
+        return {'FINISHED'}
+
+# Function to get the clicked property, as [name, path, id, data_id, data_path], and its type signature
+# Return (None, None) if there is no valid property in the context
+def mc_button_link_item(context):
+    
+    if not hasattr(context, 'button_prop') or not hasattr(context, 'button_pointer'):
+        return None, None
+    
+    prop = context.button_prop
+    item = mc_property_item(context.button_pointer, prop.identifier, prop.name)
+    if item is None:
+        return None, None
+    try:
+        signature = mc_rna_signature(context.button_pointer, item[2])
+    except Exception:
+        signature = None
+    
+    return item, signature
+
+# Function to get the indices of the properties of a menu compatible with a type signature
+def mc_link_compatible_indices(obj, signature):
+    
+    indices = set()
+    for el_signature, el_indices in mc_signature_indices_get(obj)[3].items():
+        if mc_signatures_compatible(el_signature, signature):
+            indices.update(el_indices)
+    
+    return indices
+
+# Function to link a property, given as [name, path, id, data_id, data_path], to the i-th property of the menu
+# link_type is the type signature of the property to link
+# Return the type and the message of the report for the operator
+def mc_link_property(obj, i, item, link_type):
+    
+    settings = bpy.context.scene.mc_settings
+    rna = item[1]
+    path = item[2]
+    
+    prop_type = mc_property_signature(obj, ['',obj.mc_properties[i].path,obj.mc_properties[i].id])
+    
+    if not mc_signatures_compatible(prop_type, link_type):
+        if settings.ms_debug:
+            print('MenuCreator - Property \'' + path + '\' can not be linked to \'' + obj.mc_properties[i].name + '\'')
+            print('              Data types are ' + str(link_type) + ' and ' + str(prop_type) + '.')
+        return {'ERROR'}, 'Menu Creator - Property \'' + path + '\' can not be linked to \'' + obj.mc_properties[i].name + '\''
+    
+    for el in obj.mc_properties[i].linked_props:
+        if el.path == rna and el.id == path:
+            return {'WARNING'}, 'Menu Creator - Property \'' + path + '\' already linked to \'' + obj.mc_properties[i].name + '\''
+    
+    add_item = obj.mc_properties[i].linked_props.add()
+    add_item.id = path
+    add_item.path = rna
+    add_item.data_id = item[3]
+    add_item.data_path = item[4]
+    if obj.mc_link_drivers and not obj.mc_properties[i].link_bidirectional:
+        mc_link_driver_add(obj.mc_properties[i], add_item)
+    mc_links_invalidate()
+    
+    return {'INFO'}, 'Menu Creator - Property \'' + path + '\' linked to \'' + obj.mc_properties[i].name + '\''
+
+# Operator to link a property to another one
+class MC_LinkProperty(bpy.types.Operator):
+    """Link the selected property to this one"""
+    bl_idname = "mc.link_property"
+    bl_label = "Link Property"
+    
+    prop_id: bpy.props.StringProperty()
+    prop_path: bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+
+        if hasattr(context, 'button_prop') and hasattr(context, 'button_pointer'):
+            
+            item, link_type = mc_button_link_item(context)
+            if item is None:
+                self.report({'WARNING'}, 'Menu Creator - Invalid selection.')
+                return {'FINISHED'}
+            
+            if obj.mc_enable:
+        
+                i = mc_find_index(obj.mc_properties, ['',self.prop_path,self.prop_id])
+                if i<0:
+                    self.report({'ERROR'}, 'Menu Creator - Property not found in the \'' + obj.name + '\' menu.')
+                    return {'FINISHED'}
+                
+                self.report(*mc_link_property(obj, i, item, link_type))
+            
+            else:
+                self.report({'ERROR'}, 'Menu Creator - Can not link property in \'' + obj.name + '\'. No menu has been initialized.') 
+
+        return {'FINISHED'}
+
+# Items of the search popup of MC_LinkPropertySearch, and the type signature of the property to link
+# They are stored here as Blender needs the enum items to be kept alive while the popup is open
+mc_link_search_items = []
+mc_link_search_signature = None
+
+# Function to create an array of tuples for the link search popup
+def mc_link_search_list(self, context):
+    return mc_link_search_items
+
+# Operator to search the property to link to, for menus with many properties
+class MC_LinkPropertySearch(bpy.types.Operator):
+    """Search the property of the Menu to link the selected property to"""
+    bl_idname = "mc.link_property_search"
+    bl_label = "Search Property to Link"
+    bl_property = "target"
+    
+    target : bpy.props.EnumProperty(items=mc_link_search_list)
+    link_path : bpy.props.StringProperty()
+    link_id : bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = int(self.target)
+        if i >= len(obj.mc_properties):
+            return {'CANCELLED'}
+        
+        data_id, data_path = mc_split_path(self.link_path)
+        item = ['', self.link_path, self.link_id, data_id, data_path]
+        self.report(*mc_link_property(obj, i, item, mc_link_search_signature))
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        global mc_link_search_signature
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        item, signature = mc_button_link_item(context)
+        if item is None or not obj.mc_enable:
+            self.report({'WARNING'}, 'Menu Creator - Invalid selection.')
+            return {'CANCELLED'}
+        
+        self.link_path = item[1]
+        self.link_id = item[2]
+        mc_link_search_signature = signature
+        
+        props = obj.mc_properties
+        mc_link_search_items.clear()
+        k = 0
+        for i in sorted(mc_link_compatible_indices(obj, signature)):
+            icon = props[i].icon if props[i].icon != "NONE" else "DOT"
+            mc_link_search_items.append( (str(i), props[i].section + ': ' + props[i].name, props[i].path + '.' + props[i].id, icon, k) )
+            k = k + 1
+        
+        context.window_manager.invoke_search_popup(self)
+        
+        return {'RUNNING_MODAL'}
+
+# Operator to add the collection to the selected section
+class MC_AddCollection(bpy.types.Operator):
+    """Add the collection to the selected section"""
+    bl_idname = "mc.add_collection"
+    bl_label = "Add collection to Menu"
+    
+    section: bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        add_coll = bpy.context.collection
+        
+        sec_index = mc_find_index_section(obj.mc_sections, self.section)
+        if sec_index<0:
+            self.report({'ERROR'}, 'Menu Creator - Section \''+self.section+'\' not found.')
+            return {'FINISHED'}
+
+        i=True
+        for el in obj.mc_sections[sec_index].collections:
+            if el.collection == add_coll:
+                i=False
+                break
+        if i:
+            add_item = obj.mc_sections[sec_index].collections.add()
+            add_item.collection = add_coll
+            mc_menu_changed(obj)
+            self.report({'INFO'}, 'Menu Creator - Collection has been added to section \''+self.section+'\'.')
+        else:
+            self.report({'WARNING'}, 'Menu Creator - Collection was already added to section \''+self.section+'\'.')
+
+        return {'FINISHED'}
+
+# Operator to add all the properties of a kind to the menu
+class MC_AddAllProperties(bpy.types.Operator):
+    """Add all the custom properties, shape keys or modifier toggles of the active Object to the menu"""
+    bl_idname = "mc.add_all_properties"
+    bl_label = "Add all properties to Menu"
+    bl_options = {'UNDO'}
+    
+    type : bpy.props.EnumProperty(name='Type',
+        description="Choose the properties to add",items=mc_add_all_type_list)
+    section : bpy.props.EnumProperty(name='Section',
+        description="Choose the section where the properties will be added",items=mc_section_list)
+    render : bpy.props.BoolProperty(name="Render Toggles",
+        description="Also add the modifiers render visibility toggles")
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        source = context.active_object
+        
+        if not obj.mc_enable:
+            self.report({'ERROR'}, 'Menu Creator - Can not add properties to \'' + obj.name + '\'. No menu has been initialized.')
+            return {'FINISHED'}
+        
+        if self.type == "CUSTOM_OBJECT":
+            items = mc_custom_property_items(source)
+        elif self.type == "CUSTOM_DATA":
+            if source.data is None:
+                self.report({'WARNING'}, 'Menu Creator - \'' + source.name + '\' has no Object Data.')
+                return {'FINISHED'}
+            items = mc_custom_property_items(source.data)
+        elif self.type == "SHAPE_KEYS":
+            items = mc_shape_key_items(source)
+        else:
+            items = mc_modifier_toggle_items(source, self.render)
+        
+        added = mc_add_property_items(obj.mc_properties, items, self.section)
+        
+        self.report({'INFO'}, 'Menu Creator - ' + str(added) + ' properties added to the \'' + obj.name + '\' menu (' + str(len(items) - added) + ' already added).')
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def draw(self, context):
+        
+        layout = self.layout
+        
+        layout.label(text="Source: " + context.active_object.name, icon="OBJECT_DATA")
+        layout.prop(self, "type")
+        layout.prop(self, "section")
+        if self.type == "MODIFIERS":
+            layout.prop(self, "render")
+
+class WM_MT_button_context(Menu):
+    bl_label = "Custom Action"
+
+    def draw(self, context):
+        pass
+
+def menu_func(self, context):
+    
+    if hasattr(context, 'button_prop'):
+        layout = self.layout
+        layout.separator()
+        layout.operator(MC_AddProperty.bl_idname)
+        
+def menu_func_link(self, context):
+    
+    if hasattr(context, 'button_prop'):
+        layout = self.layout
+        #layout.label(text="Try")
+        self.layout.menu(OUTLINER_MT_link_mcmenu.bl_idname)
+
+class OUTLINER_MT_collection(Menu):
+    bl_label = "Custom Action Collection"
+
+    def draw(self, context):
+        pass
+
+# Operator to create the list of sections when right clicking on the property -> Link to property
+# Only the properties compatible with the clicked property are listed, grouped by section
+class OUTLINER_MT_link_mcmenu(bpy.types.Menu):
+    bl_idname = 'mc.menu_link'
+    bl_label = 'Link to Property'
+    
+    # Maximum number of properties listed in the menu: with more properties, only the search is shown
+    max_properties = 40
+
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        layout = self.layout
+        
+        item, signature = mc_button_link_item(context)
+        compatible = mc_link_compatible_indices(obj, signature) if item is not None else set()
+        
+        if len(compatible) == 0:
+            layout.label(text="No compatible properties found")
+            return
+        
+        layout.operator(MC_LinkPropertySearch.bl_idname, text="Search...", icon="VIEWZOOM")
+        
+        if len(compatible) > self.max_properties:
+            layout.label(text=str(len(compatible)) + " compatible properties")
+            return
+        
+        props = obj.mc_properties
+        sections = obj.mc_sections
+        for sec_index, sec_rows, sec_empty, sec_hidden in mc_draw_plan(obj):
+            rows = [i for i in sec_rows if i in compatible]
+            if len(rows) == 0:
+                continue
+            sec = sections[sec_index]
+            layout.separator()
+            layout.label(text=sec.name, icon=sec.icon if sec.icon not in ("", "NONE") else "NONE")
+            for i in rows:
+                op = layout.operator(MC_LinkProperty.bl_idname, text=props[i].name, icon=props[i].icon)
+                op.prop_id = props[i].id
+                op.prop_path = props[i].path
+
+# Operator to create the list of sections when right clicking on the collection -> Add collection to Section
+class OUTLINER_MT_collection_mcmenu(bpy.types.Menu):
+    bl_idname = 'mc.menu_collection'
+    bl_label = 'Add Collection to Section'
+
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        layout = self.layout
+        
+        no_col_sec = True
+        for sec in obj.mc_sections:
+            if sec.type == "COLLECTION":
+                layout.operator(MC_AddCollection.bl_idname, text=sec.name, icon=sec.icon).section = sec.name
+                no_col_sec = False
+        
+        if no_col_sec:
+            layout.label(text="No Collection List sections found")
+
+def mc_collection_menu(self, context):
+    self.layout.separator()
+    self.layout.menu(OUTLINER_MT_collection_mcmenu.bl_idname)
+
+# Operator to clean all properties and sections from all objects
+class MC_CleanAll(bpy.types.Operator):
+    """Clean all the menus.\nIf you choose reset, it will also delete all Menu options from all objects"""
+    bl_idname = "mc.cleanprop"
+    bl_label = "Clean all the properties"
+    
+    reset : BoolProperty(default=False)
+    
+    def execute(self, context):
+        
+        # The link drivers would be left driving the targets, with no way to remove them from the addon
+        for obj in mc_registry_objects():
+            if obj.mc_link_drivers:
+                mc_link_drivers(obj, False)
+        mc_clean_properties()
+        mc_clean_sections()
+        mc_links_invalidate()
+        
+        if self.reset:
+            for obj in mc_registry_objects():
+                obj.mc_enable = False
+            mc_registry_clear()
+        
+        self.report({'INFO'}, 'Menu Creator - All the objects has been reset.')
+        
+        return {'FINISHED'}
+
+# Operator to clean all properties and sections from an objects. If reset is on, it will also disable the menu for that object
+class MC_CleanObject(bpy.types.Operator):
+    """Clean all the object properties.\nIf you choose reset, it will also delete all Menu options from the object"""
+    bl_idname = "mc.cleanpropobj"
+    bl_label = "Clean the object"
+    
+    reset : BoolProperty(default=False)
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        # The link drivers would be left driving the targets, with no way to remove them from the addon
+        if obj.mc_link_drivers:
+            mc_link_drivers(obj, False)
+        mc_clean_single_properties(obj)
+        mc_clean_single_sections(obj)
+        mc_links_invalidate()
+        if self.reset:
+            obj.mc_enable = False
+            mc_registry_remove(obj)
+        
+        self.report({'INFO'}, 'Menu Creator - \'' + obj.name + '\' menu has been reset.')
+        
+        return {'FINISHED'}
+
+# Operator to remove a linked property (button in UI)
+class MC_RemoveLinkedProperty(bpy.types.Operator):
+    """Remove the linked property"""
+    bl_idname = "mc.removelinkedproperty"
+    bl_label = ""
+    
+    prop_index : bpy.props.IntProperty()
+    link_path : bpy.props.StringProperty()
+    link_id : bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        props = obj.mc_properties
+        
+        i=-1
+        for el in obj.mc_properties[self.prop_index].linked_props:
+            i=i+1
+            if el.path == self.link_path and el.id == self.link_id:
+                if obj.mc_link_drivers:
+                    mc_link_driver_remove(el)
+                obj.mc_properties[self.prop_index].linked_props.remove(i)
+                mc_links_invalidate()
+                break
+
+        return {'FINISHED'}
+
+# Operator to add or remove a point of the remap curve of a linked property
+class MC_LinkMapPoint(bpy.types.Operator):
+    """Add or remove a point of the remap curve"""
+    bl_idname = "mc.linkmappoint"
+    bl_label = ""
+    bl_options = {'UNDO'}
+    
+    prop_index : bpy.props.IntProperty()
+    link_index : bpy.props.IntProperty()
+    point_index : bpy.props.IntProperty()
+    remove : bpy.props.BoolProperty(default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        link_prop = obj.mc_properties[self.prop_index].linked_props[self.link_index]
+        points = link_prop.map_points
+        if self.remove:
+            points.remove(self.point_index)
+        elif len(points) == 0:
+            point = points.add()
+            point = points.add()
+            point.x = 1.
+            point.y = 1.
+        else:
+            last = points[len(points)-1]
+            point = points.add()
+            point.x = last.x + 1.
+            point.y = last.y
+        mc_link_resync(link_prop)
+        
+        return {'FINISHED'}
+
+# Single Property settings
+class MC_PropertySettings(bpy.types.Operator):
+    """Modify some of the property settings"""
+    bl_idname = "mc.propsettings"
+    bl_label = "Property settings"
+    bl_icon = "PREFERENCES"
+    bl_options = {'UNDO'}
+    
+    name : bpy.props.StringProperty(name='Name',
+        description="Choose the name of the property")
+    path : bpy.props.StringProperty()
+    id : bpy.props.StringProperty()
+    icon : bpy.props.EnumProperty(name='Icon',
+        description="Choose the icon.\nNote that the icon name MUST respect Blender convention. All the icons can be found in the Icon Viewer default Blender addon.",items=mc_icon_list)
+    section : bpy.props.EnumProperty(name='Section',
+        description="Choose the icon.\nNote that the icon name MUST respect Blender convention. All the icons can be found in the Icon Viewer default Blender addon.",items=mc_section_list)
+    link_bidirectional : bpy.props.BoolProperty(name='Bidirectional',
+        description="Sync the property and the linked properties in both directions.\nThe last edited property is written to the others")
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index(obj.mc_properties,[self.name,self.path,self.id])
+        
+        if i>=0:
+            obj.mc_properties[i].name = self.name
+            obj.mc_properties[i].icon = self.icon
+            obj.mc_properties[i].section = self.section
+            if obj.mc_properties[i].link_bidirectional != self.link_bidirectional:
+                obj.mc_properties[i].link_bidirectional = self.link_bidirectional
+            mc_menu_changed(obj)
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index(obj.mc_properties,[self.name,self.path,self.id])
+        if i>=0:
+            self.link_bidirectional = obj.mc_properties[i].link_bidirectional
+                
+        if settings.ms_debug:
+            return context.window_manager.invoke_props_dialog(self, width=650)
+        else:
+            return context.window_manager.invoke_props_dialog(self, width=550)
+            
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index(obj.mc_properties,[self.name,self.path,self.id])
+        
+        layout = self.layout
+        
+        layout.prop(self, "name")
+        layout.prop(self, "icon")
+        layout.prop(self, "section")
+        
+        layout.separator()
+        layout.label(text="Property info", icon="INFO")
+        box = layout.box()
+        box.label(text="Identifier: "+self.id)
+        
+        if settings.ms_debug:
+            layout.label(text="Full path", icon="RNA")
+            box = layout.box()
+            box.label(text=self.path+'.'+self.id)
+        
+        if i>=0 and len(obj.mc_properties[i].linked_props)>0:
+            layout.separator()
+            layout.label(text="Linked Properties", icon="LINKED")
+            box = layout.box()
+            box.prop(self, "link_bidirectional")
+            for j, prop in enumerate(obj.mc_properties[i].linked_props):
+                row = box.row()
+                row.label(text=prop.path + '.' + prop.id, icon="DOT")
+                if not self.link_bidirectional:
+                    row.prop(prop, "map_enable", text="", icon="FCURVE")
+                link_del_op = row.operator(MC_RemoveLinkedProperty.bl_idname, icon="X")
+                link_del_op.prop_index = i
+                link_del_op.link_id = prop.id
+                link_del_op.link_path = prop.path
+                
+                # Mapping settings
+                if prop.map_enable and not self.link_bidirectional:
+                    col = box.box().column(align=True)
+                    row = col.row(align=True)
+                    row.prop(prop, "map_factor")
+                    row.prop(prop, "map_offset")
+                    row = col.row(align=True)
+                    row.prop(prop, "map_clamp")
+                    row.prop(prop, "map_min")
+                    row.prop(prop, "map_max")
+                    row = col.row(align=True)
+                    row.prop(prop, "map_invert")
+                    row.prop(prop, "map_curve")
+                    if prop.map_curve:
+                        for k, point in enumerate(prop.map_points):
+                            row = col.row(align=True)
+                            row.prop(point, "x")
+                            row.prop(point, "y")
+                            point_op = row.operator(MC_LinkMapPoint.bl_idname, icon="X")
+                            point_op.prop_index = i
+                            point_op.link_index = j
+                            point_op.point_index = k
+                            point_op.remove = True
+                        point_op = col.operator(MC_LinkMapPoint.bl_idname, text="Add Point", icon="ADD")
+                        point_op.prop_index = i
+                        point_op.link_index = j
+                        point_op.remove = False
+                
+
+# Swap Properties Operator
+class MC_SwapProperty(bpy.types.Operator):
+    """Change the position of the property.\nShift click to move it to the top or the bottom of the section.\nIf the property is selected, all the selected properties of the section are moved together"""
+    bl_idname = "mc.swapprops"
+    bl_label = "Change the property position"
+    
+    mod : BoolProperty(default=False) # False = down, True = Up
+    end : BoolProperty(default=False) # Move to the top/bottom of the section
+    
+    name : bpy.props.StringProperty()
+    path : bpy.props.StringProperty()
+    id : bpy.props.StringProperty()
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index(obj.mc_properties,[self.name,self.path,self.id])
+    
+        if i>=0:
+            if self.mod:
+                mc_move_property(obj, i, "TOP" if self.end else "UP")
+            else:
+                mc_move_property(obj, i, "BOTTOM" if self.end else "DOWN")
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        self.end = event.shift
+        
+        return self.execute(context)
+
+# Move Property Operator
+class MC_MoveProperty(bpy.types.Operator):
+    """Move the property to a new position in its section.\nIf the property is selected, all the selected properties of the section are moved together"""
+    bl_idname = "mc.moveprop"
+    bl_label = "Move the property"
+    bl_options = {'UNDO'}
+    
+    path : bpy.props.StringProperty()
+    id : bpy.props.StringProperty()
+    position : bpy.props.EnumProperty(name='Position',
+        items=mc_order_position_list)
+    index : bpy.props.IntProperty(name='Index',
+        description="New position in the section, used with the Index position", min=0)
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index(obj.mc_properties,['',self.path,self.id])
+        
+        if i>=0:
+            mc_move_property(obj, i, self.position, self.index)
+        
+        return {'FINISHED'}
+
+# Operator to remove a property (button in UI)
+class MC_RemoveProperty(bpy.types.Operator):
+    """Remove the property from the current menu"""
+    bl_idname = "mc.removeproperty"
+    bl_label = "Remove the property"
+    
+    path : bpy.props.StringProperty()
+    id : bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        props = obj.mc_properties
+        
+        i = mc_find_index(props,['',self.path,self.id])
+        if i>=0 and obj.mc_link_drivers:
+            for link_prop in props[i].linked_props:
+                mc_link_driver_remove(link_prop)
+        
+        if mc_remove_property_item(obj.mc_properties,['',self.path,self.id]):
+            mc_links_invalidate()
+
+        return {'FINISHED'}
+
+# Operator to add a new section
+class MC_AddSection(bpy.types.Operator):
+    """Add a new section to the section list."""
+    bl_idname = "mc.addsection"
+    bl_label = "Add section"
+    bl_icon = "PREFERENCES"
+    bl_options = {'UNDO'}
+    
+    name : bpy.props.StringProperty(name='Name',
+        description="Choose the name of the section", default = "Section")
+    icon : bpy.props.EnumProperty(name='Icon',
+        description="Choose the icon.\nNote that the icon name MUST respect Blender convention. All the icons can be found in the Icon Viewer default Blender addon",items=mc_icon_list)
+    collapsable : bpy.props.BoolProperty(name="Collapsable",
+        description="Add a collapse button near the name of the section")
+    type : bpy.props.EnumProperty(name='Type',
+        description="Choose the section type",items=mc_section_type_list)
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        sec_obj = obj.mc_sections
+        
+        if self.name!="":
+           
+            i = mc_find_index_section(sec_obj, self.name) < 0
+            if i:
+                add_item = sec_obj.add()
+                add_item.name = self.name
+                add_item.type = self.type
+                add_item.icon = self.icon
+                add_item.collapsable = self.collapsable
+                # New sections are added at the bottom
+                add_item.id = mc_order_keys_between(mc_section_indices_get(obj)[4], None, 1)[0]
+                mc_menu_changed(obj)
+            
+                self.report({'INFO'}, 'Menu Creator - Section \'' + self.name +'\' created.')
+            else:
+                self.report({'WARNING'}, 'Menu Creator - Cannot create sections with same name.')
+        
+        else:
+            self.report({'ERROR'}, 'Menu Creator - Cannot create sections with this name.')
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        settings = bpy.context.scene.mc_settings
+                
+        if settings.ms_debug:
+            return context.window_manager.invoke_props_dialog(self, width=550)
+        else:
+            return context.window_manager.invoke_props_dialog(self)
+            
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        
+        layout = self.layout
+        
+        scale = 3.0
+        
+        row=layout.row()
+        row.label(text="Name:")
+        row.scale_x=scale
+        row.prop(self, "name", text="")
+        
+        row=layout.row()
+        row.label(text="Icon:")
+        row.scale_x=scale
+        row.prop(self, "icon", text="")
+        
+        row=layout.row()
+        row.label(text="")
+        row.scale_x=scale
+        row.prop(self, "collapsable")
+        
+        layout.separator()
+        
+        row=layout.row()
+        row.label(text="Type:")
+        row.scale_x=scale
+        row.prop(self, "type", text="")
+
+# Section Property settings
+class MC_SectionSettings(bpy.types.Operator):
+    """Modify the section settings."""
+    bl_idname = "mc.sectionsettings"
+    bl_label = "Section settings"
+    bl_icon = "PREFERENCES"
+    bl_options = {'UNDO'}
+    
+    name : bpy.props.StringProperty(name='Name',
+        description="Choose the name of the section")
+    icon : bpy.props.EnumProperty(name='Icon',
+        description="Choose the icon.\nNote that the icon name MUST respect Blender convention. All the icons can be found in the Icon Viewer default Blender addon.",items=mc_icon_list)
+    collapsable : bpy.props.BoolProperty(name="Collapsable",
+        description="Add a collapse button near the name of the section")
+    type : bpy.props.EnumProperty(name='Type',
+        description="The Section type can not be changed after creation",items=mc_section_type_list)
+    
+    # COLLECTION type settings
+    collections_enable_global_smoothcorrection : bpy.props.BoolProperty(name="Enable Global Smooth Correction")
+    collections_enable_global_shrinkwrap : bpy.props.BoolProperty(name="Enable Global Shrinkwrap")
+    collections_enable_global_mask : bpy.props.BoolProperty(name="Enable Global Mask")
+    collections_enable_global_normalautosmooth : bpy.props.BoolProperty(name="Enable Global Normal Auto Smooth")
+    # Outfit variant
+    outfit_enable : bpy.props.BoolProperty(name="Outfit", description="With this option a Body entry will be added to the Section. This Body's masks will be enabled when elements of the collections are shown, and viceversa, if the masks are called the same name as the element of the collection")
+    outfit_mask_mode : bpy.props.EnumProperty(name="Masks", items=mc_outfit_mask_mode_list, description="Choose how the mask modifiers of the Body are assigned to the objects of the collections")
+    collections_exclude : bpy.props.BoolProperty(name="Exclude from View Layer", description="Exclude the inactive collections from the View Layer instead of hiding them.\nExcluded collections are removed from the scene evaluation, saving memory with many heavy collections")
+            
+    name_edit : bpy.props.StringProperty(name='Name',
+        description="Choose the name of the section")
+    ID : bpy.props.IntProperty()
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        prop_obj = obj.mc_properties
+        sec_obj = obj.mc_sections
+        
+        
+        i = mc_find_index_section(sec_obj,self.name)
+        
+        if self.name_edit != self.name and mc_find_index_section(sec_obj,self.name_edit)>=0:
+            self.report({'WARNING'}, 'Menu Creator - Cannot create sections with same name.')
+            return {'FINISHED'}
+        
+        if i>=0:
+            
+            if self.name_edit != self.name:
+                for j in mc_section_property_indices(obj, self.name):
+                    prop_obj[j].section = self.name_edit
+           
+            sec_obj[i].name = self.name_edit
+            sec_obj[i].icon = self.icon
+            sec_obj[i].collapsable = self.collapsable
+            sec_obj[i].collections_enable_global_smoothcorrection = self.collections_enable_global_smoothcorrection
+            sec_obj[i].collections_enable_global_shrinkwrap = self.collections_enable_global_shrinkwrap
+            sec_obj[i].collections_enable_global_mask = self.collections_enable_global_mask
+            sec_obj[i].collections_enable_global_normalautosmooth = self.collections_enable_global_normalautosmooth
+            sec_obj[i].outfit_enable = self.outfit_enable
+            sec_obj[i].outfit_mask_mode = self.outfit_mask_mode
+            if sec_obj[i].collections_exclude != self.collections_exclude:
+                sec_obj[i].collections_exclude = self.collections_exclude
+            if obj.type == "MESH":
+                sec_obj[i].outfit_body = obj
+            mc_menu_changed(obj)
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        settings = bpy.context.scene.mc_settings
+        
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        sec_obj = obj.mc_sections
+        
+        self.name_edit = self.name
+        self.ID = mc_find_index_section(sec_obj,self.name)
+        self.collapsable = sec_obj[self.ID].collapsable
+        self.collections_enable_global_smoothcorrection = sec_obj[self.ID].collections_enable_global_smoothcorrection
+        self.collections_enable_global_shrinkwrap = sec_obj[self.ID].collections_enable_global_shrinkwrap
+        self.collections_enable_global_mask = sec_obj[self.ID].collections_enable_global_mask
+        self.collections_enable_global_normalautosmooth = sec_obj[self.ID].collections_enable_global_normalautosmooth
+        self.outfit_enable = sec_obj[self.ID].outfit_enable
+        self.outfit_mask_mode = sec_obj[self.ID].outfit_mask_mode
+        self.collections_exclude = sec_obj[self.ID].collections_exclude
+        
+        return context.window_manager.invoke_props_dialog(self)
+            
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        sec_obj = obj.mc_sections
+        
+        scale = 3.0
+        
+        layout = self.layout
+        
+        row=layout.row()
+        row.label(text="Name:")
+        row.scale_x=scale
+        row.prop(self, "name_edit", text="")
+        
+        row=layout.row()
+        row.label(text="Icon:")
+        row.scale_x=scale
+        row.prop(self, "icon", text="")
+        
+        row=layout.row()
+        row.label(text="")
+        row.scale_x=scale
+        row.prop(self, "collapsable")
+        
+        layout.separator()
+        col = layout.column()
+        col.enabled = False
+        col.prop(self, "type")
+        if self.type == "COLLECTION":
+            layout.separator()
+            row = layout.row()
+            row.label(text="")
+            row.scale_x = 3
+            row.prop(self,"collections_enable_global_smoothcorrection")
+            row = layout.row()
+            row.label(text="")
+            row.scale_x = 3
+            row.prop(self,"collections_enable_global_shrinkwrap")
+            row = layout.row()
+            row.label(text="")
+            row.scale_x = 3
+            row.prop(self,"collections_enable_global_mask")
+            row = layout.row()
+            row.label(text="")
+            row.scale_x = 3
+            row.prop(self,"collections_enable_global_normalautosmooth")
+            row = layout.row()
+            row.label(text="")
+            row.scale_x = 3
+            row.prop(self,"collections_exclude")
+            layout.separator()
+            row = layout.row()
+            row.label(text="")
+            row.scale_x = 3
+            row.prop(self,"outfit_enable")
+            if self.outfit_enable:
+                row = layout.row()
+                row.label(text="")
+                row.scale_x = 3
+                row.prop(self,"outfit_mask_mode")
+
+# Operator to change Section position
+class MC_SwapSection(bpy.types.Operator):
+    """Change the position of the section.\nShift click to move it to the top or the bottom of the menu"""
+    bl_idname = "mc.swapsections"
+    bl_label = "Change the section position"
+    
+    mod : BoolProperty(default=False) # False = down, True = Up
+    end : BoolProperty(default=False) # Move to the top/bottom of the menu
+    
+    name : bpy.props.StringProperty()
+    icon : bpy.props.StringProperty()
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        sec_index = mc_find_index_section(obj.mc_sections,self.name)
+        
+        if sec_index>=0:
+            if self.mod:
+                mc_move_section_to(obj, sec_index, "TOP" if self.end else "UP")
+            else:
+                mc_move_section_to(obj, sec_index, "BOTTOM" if self.end else "DOWN")
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        self.end = event.shift
+        
+        return self.execute(context)
+
+# Operator to move a Section to a new position
+class MC_MoveSection(bpy.types.Operator):
+    """Move the section to a new position"""
+    bl_idname = "mc.movesection"
+    bl_label = "Move the section"
+    bl_options = {'UNDO'}
+    
+    name : bpy.props.StringProperty()
+    position : bpy.props.EnumProperty(name='Position',
+        items=mc_order_position_list)
+    index : bpy.props.IntProperty(name='Index',
+        description="New position in the menu, used with the Index position", min=0)
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        sec_index = mc_find_index_section(obj.mc_sections,self.name)
+        
+        if sec_index>=0:
+            mc_move_section_to(obj, sec_index, self.position, self.index)
+        
+        return {'FINISHED'}
+
+# Delete Section
+class MC_DeleteSection(bpy.types.Operator):
+    """Delete Section"""
+    bl_idname = "mc.deletesection"
+    bl_label = "Section settings"
+    bl_options = {'UNDO'}
+    
+    name : bpy.props.StringProperty(name='Name',
+        description="Choose the name of the section")
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        sec_obj = obj.mc_sections
+        
+        i = mc_find_index_section(sec_obj,self.name)
+        
+        if i>=0:
+            
+            # The ordering ids do not need to be consecutive, so the other sections are not changed
+            sec_obj.remove(i)
+            mc_menu_changed(obj)
+        
+        self.report({'INFO'}, 'Menu Creator - Section \'' + self.name +'\' deleted.')
+        
+        return {'FINISHED'}
+
+# Operator to shiwtch visibility of an object
+class MC_CollectionObjectVisibility(bpy.types.Operator):
+    """Chenge the visibility of the selected object"""
+    bl_idname = "mc.colobjvisibility"
+    bl_label = "Hide/Unhide Object visibility"
+    bl_options = {'UNDO'}
+    
+    obj : bpy.props.StringProperty()
+    sec : bpy.props.StringProperty()
+
+    def execute(self, context):
+        
+        bpy.data.objects[self.obj].hide_viewport = not bpy.data.objects[self.obj].hide_viewport
+        bpy.data.objects[self.obj].hide_render = not bpy.data.objects[self.obj].hide_render
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            body_obj = settings.em_fixobj_pointer
+        else:
+            body_obj = context.active_object
+        sec_obj = body_obj.mc_sections
+        i = mc_find_index_section(sec_obj,self.sec)
+        
+        if i>=0 and sec_obj[i].outfit_enable:
+            if sec_obj[i].outfit_body:
+                if sec_obj[i].collections_global_mask:
+                    for modifier in mc_outfit_masks(sec_obj[i], mc_outfit_mask_map(sec_obj[i]), self.obj):
+                        modifier.show_viewport = not bpy.data.objects[self.obj].hide_viewport
+                        modifier.show_render = not bpy.data.objects[self.obj].hide_viewport
+            else:
+                self.report({'WARNING'}, 'Menu Creator - Outfit Body has not been specified.')
+        
+        return {'FINISHED'}
+
+# Operator to add or remove a manual mask assignment of an outfit section
+class MC_OutfitMask(bpy.types.Operator):
+    """Add or remove a mask modifier manually assigned to an object"""
+    bl_idname = "mc.outfitmask"
+    bl_label = ""
+    bl_options = {'UNDO'}
+    
+    sec : bpy.props.StringProperty()
+    index : bpy.props.IntProperty()
+    remove : bpy.props.BoolProperty(default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index_section(obj.mc_sections, self.sec)
+        if i < 0:
+            return {'CANCELLED'}
+        
+        if self.remove:
+            obj.mc_sections[i].outfit_masks.remove(self.index)
+        else:
+            obj.mc_sections[i].outfit_masks.add()
+        
+        return {'FINISHED'}
+
+# Operator to save the visibility of the objects of a collection section as an outfit preset
+class MC_OutfitPresetSave(bpy.types.Operator):
+    """Save the visibility of the objects as a preset.\nA preset with the same name is overwritten"""
+    bl_idname = "mc.outfitpresetsave"
+    bl_label = "Save Outfit Preset"
+    bl_options = {'UNDO'}
+    
+    sec : bpy.props.StringProperty()
+    name : bpy.props.StringProperty(name="Name", default="Outfit")
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index_section(obj.mc_sections, self.sec)
+        if i < 0 or self.name == "":
+            return {'CANCELLED'}
+        sec = obj.mc_sections[i]
+        
+        preset = None
+        for el in sec.outfit_presets:
+            if el.name == self.name:
+                preset = el
+                break
+        if preset is None:
+            preset = sec.outfit_presets.add()
+            preset.name = self.name
+        
+        preset.objects.clear()
+        objects = mc_outfit_objects(sec)
+        for outfit in objects:
+            preset.objects.add().object = outfit
+        preset.bits = mc_bitset_encode([not outfit.hide_viewport for outfit in objects])
+        
+        self.report({'INFO'}, 'Menu Creator - Outfit preset \'' + self.name + '\' saved.')
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Operator to apply an outfit preset, in a single undo step
+class MC_OutfitPresetApply(bpy.types.Operator):
+    """Apply the outfit preset"""
+    bl_idname = "mc.outfitpresetapply"
+    bl_label = "Apply Outfit Preset"
+    bl_options = {'UNDO'}
+    
+    sec : bpy.props.StringProperty()
+    name : bpy.props.StringProperty()
+    remove : bpy.props.BoolProperty(default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index_section(obj.mc_sections, self.sec)
+        if i < 0:
+            return {'CANCELLED'}
+        sec = obj.mc_sections[i]
+        
+        for j, preset in enumerate(sec.outfit_presets):
+            if preset.name != self.name:
+                continue
+            if self.remove:
+                sec.outfit_presets.remove(j)
+            else:
+                # Objects removed after the preset has been saved are skipped
+                flags = mc_bitset_decode(preset.bits, len(preset.objects))
+                mc_outfit_apply(sec, [(el.object, flag) for el, flag in zip(preset.objects, flags) if el.object is not None])
+            return {'FINISHED'}
+        
+        self.report({'WARNING'}, 'Menu Creator - Outfit preset \'' + self.name + '\' not found.')
+        
+        return {'CANCELLED'}
+
+# Operator to show only one object of a collection section, or to hide all of them
+class MC_OutfitSolo(bpy.types.Operator):
+    """Show only this object of the collections.\nIf no object is specified, all the objects are hidden"""
+    bl_idname = "mc.outfitsolo"
+    bl_label = "Solo Outfit Object"
+    bl_options = {'UNDO'}
+    
+    sec : bpy.props.StringProperty()
+    obj : bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        i = mc_find_index_section(obj.mc_sections, self.sec)
+        if i < 0:
+            return {'CANCELLED'}
+        sec = obj.mc_sections[i]
+        
+        mc_outfit_apply(sec, [(outfit, outfit.name == self.obj) for outfit in mc_outfit_objects(sec)])
+        
+        return {'FINISHED'}
+
+# Operator to delete a collection
+class MC_RemoveCollection(bpy.types.Operator):
+    """Remove the selected collection from the Menu.\nThe collection will NOT be deleted"""
+    bl_idname = "mc.deletecollection"
+    bl_label = "Remove the selected collection from the menu"
+    bl_options = {'UNDO'}
+    
+    col : bpy.props.StringProperty()
+    sec : bpy.props.StringProperty()
+
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        sec_obj = obj.mc_sections
+        
+        sec_index = mc_find_index_section(sec_obj,self.sec)
+        if sec_index<0:
+            return {'FINISHED'}
+        
+        i = 0
+        for el in sec_obj[sec_index].collections:
+            if el.collection.name == self.col:
+                # Collections excluded by the section are included back in the view layer
+                if sec_obj[sec_index].collections_exclude:
+                    mc_collection_list_set(sec_obj[sec_index], context.view_layer, el.collection, True, True)
+                sec_obj[sec_index].collections.remove(i)
+                mc_menu_changed(obj)
+                break
+            i = i + 1
+        
+        self.report({'INFO'}, 'Menu Creator - Collection removed from the Menu.')
+        
+        return {'FINISHED'}
+
+# Operator to compile the links of the menu to drivers, or to remove them
+class MC_LinkDrivers(bpy.types.Operator):
+    """Compile the linked properties of the menu to drivers, so that they are synced by Blender also during animation playback and rendering.\nProperties already driven by other drivers are left untouched.\nIf remove is enabled, the drivers are removed and the links are synced by the addon"""
+    bl_idname = "mc.linkdrivers"
+    bl_label = "Compile Links to Drivers"
+    bl_options = {'UNDO'}
+    
+    remove : BoolProperty(default=False)
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        count = mc_link_drivers(obj, not self.remove)
+        
+        if self.remove:
+            self.report({'INFO'}, 'Menu Creator - ' + str(count) + ' drivers removed from the \'' + obj.name + '\' menu links.')
+        else:
+            self.report({'INFO'}, 'Menu Creator - ' + str(count) + ' drivers created for the \'' + obj.name + '\' menu links.')
+        
+        return {'FINISHED'}
+
+# Operator to clear the profiling statistics
+class MC_ProfileReset(bpy.types.Operator):
+    """Clear the profiling statistics"""
+    bl_idname = "mc.profile_reset"
+    bl_label = "Reset Statistics"
+    
+    def execute(self, context):
+        
+        mc_stats_clear()
+        
+        return {'FINISHED'}
+
+# Operator to export the profiling statistics to a JSON or CSV file
+class MC_ProfileExport(bpy.types.Operator):
+    """Export the profiling statistics to a JSON or CSV file"""
+    bl_idname = "mc.profile_export"
+    bl_label = "Export Statistics"
+    
+    filepath : bpy.props.StringProperty(subtype="FILE_PATH")
+    filter_glob : bpy.props.StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+    
+    def execute(self, context):
+        
+        timings, caches = mc_stats_rows()
+        
+        try:
+            with open(self.filepath, 'w', newline='') as file:
+                if self.filepath.lower().endswith('.csv'):
+                    writer = csv.writer(file)
+                    writer.writerow(["kind", "name", "calls", "total_ms", "avg_ms", "max_ms", "rolling_ms", "hits", "misses", "hit_rate"])
+                    for row in timings:
+                        writer.writerow(["timing", row["name"], row["calls"], row["total_ms"], row["avg_ms"], row["max_ms"], row["rolling_ms"], "", "", ""])
+                    for row in caches:
+                        writer.writerow(["cache", row["name"], "", "", "", "", "", row["hits"], row["misses"], row["hit_rate"]])
+                else:
+                    json.dump({"blender": bpy.app.version_string, "timings": timings, "caches": caches}, file, indent=2)
+        except OSError as error:
+            self.report({'ERROR'}, 'Menu Creator - Statistics could not be exported: ' + str(error))
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, 'Menu Creator - Statistics exported to ' + self.filepath)
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        
+        if self.filepath == "":
+            self.filepath = "menu_creator_profile.json"
+        context.window_manager.fileselect_add(self)
+        
+        return {'RUNNING_MODAL'}
+
+# Initial Configuration Operator
+class MC_InitialConfiguration(bpy.types.Operator):
+    """Clean all the object properties"""
+    bl_idname = "mc.initialconfig"
+    bl_label = "Clean all the properties"
+    
+    def execute(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        if obj.mc_link_drivers:
+            mc_link_drivers(obj, False)
+        mc_clean_single_sections(obj)
+        mc_clean_single_properties(obj)
+        mc_links_invalidate()
+        
+        add_item = obj.mc_sections.add()
+        add_item.id = 0
+        add_item.name = "Unsorted"
+        add_item.icon = "LIBRARY_DATA_BROKEN"
+        mc_menu_changed(obj)
+        
+        obj.mc_enable = True
+        mc_registry_add(obj)
+        
+        self.report({'INFO'}, 'Menu Creator - Menu for \''+obj.name+'\' successfully created.')
+        
+        return {'FINISHED'}
+
+
+
+# USER INTERFACE
+
+# Poll functions
+
+@classmethod
+def mc_panel_poll(cls, context):
+    
+    settings = bpy.context.scene.mc_settings
+    if settings.em_fixobj:
+        obj = settings.em_fixobj_pointer
+    else:
+        obj = context.active_object
+    
+    return obj.mc_enable
+
+# User Interface Panels
+
+class MainPanel:
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Menu"
+
+class PT_MenuCreator_InitialConfiguration_Panel(MainPanel, bpy.types.Panel):
+    bl_idname = "PT_MenuCreator_InitialConfiguration_Panel"
+    bl_label = "Initial Configuration"
+    
+    @classmethod
+    def poll(cls, context):
+    
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        
+        if obj is not None:
+            return not obj.mc_enable
+        else:
+            return False
+    
+    def draw(self, context):
+        
+        layout = self.layout
+        
+        layout.label(text="Menu Configuration")
+        
+        layout.operator('mc.initialconfig', text="Create Menu")
+
+class PT_MenuCreator_Panel(MainPanel, bpy.types.Panel):
+    bl_idname = "PT_MenuCreator_Panel"
+    bl_label = "Menu"
+    
+    @classmethod
+    def poll(cls, context):
+    
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+    
+        if obj is not None:
+            return obj.mc_enable
+        else:
+            return False
+
+    @mc_profiled("Panel draw")
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        mc_col = obj.mc_properties
+        mcs_col = obj.mc_sections
+        
+        layout = self.layout
+        
+        row = layout.row(align=False)
+        menu_name = settings.mss_name;
+        if settings.mss_obj_name:
+            menu_name = menu_name+obj.name
+        row.label(text=menu_name)
+        
+        if settings.ms_editmode:
+            row.prop(obj, "mc_edit_enable", text="",icon="MODIFIER")
+            row.operator("mc.addsection",text="",icon="ADD")
+            row.operator("mc.add_all_properties",text="",icon="PRESET_NEW")
+            if settings.em_fixobj:
+                row.prop(settings,"em_fixobj",icon="PINNED", text="")
+            else:
+                row.prop(settings,"em_fixobj",icon="UNPINNED", text= "")
+        else:
+            if settings.em_fixobj:
+                row.prop(settings,"em_fixobj",icon="PINNED", text="")
+            else:
+                row.prop(settings,"em_fixobj",icon="UNPINNED", text= "")
+        
+        if len(mcs_col)>1:
+            
+            for sec_index, sec_rows, sec_empty, sec_hidden in mc_draw_plan(obj):
+                
+                sec = mcs_col[sec_index]
+                
+                if sec.type == "DEFAULT":
+                    
+                    if (sec_empty and sec.name == "Unsorted") or (not obj.mc_edit_enable and not sec_empty and sec_hidden):
+                        continue
+                    else:
+                        row = layout.row(align=False)
+                        if sec.collapsable:
+                            row.prop(sec, "collapsed", icon="TRIA_DOWN" if not sec.collapsed else "TRIA_RIGHT", icon_only=True, emboss=False)
+                        if sec.icon == "NONE":
+                            row.label(text=sec.name)
+                        else:
+                            row.label(text=sec.name,icon=sec.icon)
+                        
+                        if obj.mc_edit_enable:
+                            
+                            if sec.name != "Unsorted":
+                                ssett_button = row.operator("mc.sectionsettings", icon="PREFERENCES", text="")
+                                ssett_button.name = sec.name
+                                ssett_button.icon = sec.icon
+                                ssett_button.type = sec.type
+                            
+                                row2 = row.row(align=True)
+                                sup_button = row2.operator("mc.swapsections", icon="TRIA_UP", text="")
+                                sup_button.mod = True
+                                sup_button.name = sec.name
+                                sup_button.icon = sec.icon
+                                sdown_button = row2.operator("mc.swapsections", icon="TRIA_DOWN", text="")
+                                sdown_button.mod = False
+                                sdown_button.name = sec.name
+                                sdown_button.icon = sec.icon
+                        
+                        if not sec.collapsed:
+                            box = layout.box()
+                            if sec_empty and sec.name != "Unsorted":
+                                row = box.row(align=False)
+                                row.label(text="Section Empty", icon="ERROR")
+                                row.operator("mc.deletesection",text="",icon="X").name = sec.name
+                    
+                    if not sec.collapsed:
+                        
+                        for el_index in sec_rows:
+                            
+                            el = mc_col[el_index]
+                            
+                            if obj.mc_edit_enable:
+                                
+                                row = box.row(align=False)
+                                row.prop(el, "select", text="")
+                                if el.icon !="NONE":
+                                    row.label(text=el.name,icon=el.icon)
+                                else:
+                                    row.label(text=el.name)
+                                
+                                sett_button = row.operator("mc.propsettings", icon="PREFERENCES", text="")
+                                sett_button.name = el.name
+                                sett_button.path = el.path
+                                sett_button.id = el.id
+                                sett_button.icon = el.icon
+                                sett_button.section = el.section
+                                
+                                row2 = row.row(align=True)
+                                up_button = row2.operator("mc.swapprops", icon="TRIA_UP", text="")
+                                up_button.mod = True
+                                up_button.name = el.name
+                                up_button.path = el.path
+                                up_button.id = el.id
+                                down_button = row2.operator("mc.swapprops", icon="TRIA_DOWN", text="")
+                                down_button.mod = False
+                                down_button.name = el.name
+                                down_button.path = el.path
+                                down_button.id = el.id
+                                
+                                if el.hide:
+                                    row.prop(el, "hide", text="", icon = "HIDE_ON")
+                                else:
+                                    row.prop(el, "hide", text="", icon = "HIDE_OFF")
+                                
+                                del_button = row.operator("mc.removeproperty", icon="X", text="")
+                                del_button.path = el.path
+                                del_button.id = el.id
+                            else:
+                                
+                                if not el.hide:
+                                    row = box.row(align=False)
+                                    if el.icon !="NONE":
+                                        row.label(text=el.name,icon=el.icon)
+                                    else:
+                                        row.label(text=el.name)
+                                
+                                    row.scale_x=1.0
+                                    accessor = mc_resolve_accessor(el)
+                                    if accessor is not None:
+                                        row.prop(accessor.owner, el.id, text="")
+                                    else:
+                                        row.label(text="Property not found", icon="ERROR")
+                    
+                elif sec.type == "COLLECTION":
+                    
+                    sec_empty = True
+                    for el in sec.collections:
+                        sec_empty = False
+                        break
+                    
+                    row = layout.row(align=False)
+                    if sec.collapsable:
+                        row.prop(sec, "collapsed", icon="TRIA_DOWN" if not sec.collapsed else "TRIA_RIGHT", icon_only=True, emboss=False)
+                    if sec.icon == "NONE":
+                        row.label(text=sec.name)
+                    else:
+                        row.label(text=sec.name,icon=sec.icon)
+                        
+                    if obj.mc_edit_enable:
+                        
+                        ssett_button = row.operator("mc.sectionsettings", icon="PREFERENCES", text="")
+                        ssett_button.name = sec.name
+                        ssett_button.icon = sec.icon
+                        ssett_button.type = sec.type
+                        
+                        row2 = row.row(align=True)
+                        sup_button = row2.operator("mc.swapsections", icon="TRIA_UP", text="")
+                        sup_button.mod = True
+                        sup_button.name = sec.name
+                        sup_button.icon = sec.icon
+                        sdown_button = row2.operator("mc.swapsections", icon="TRIA_DOWN", text="")
+                        sdown_button.mod = False
+                        sdown_button.name = sec.name
+                        sdown_button.icon = sec.icon
+                        
+                        row.operator("mc.deletesection",text="",icon="X").name = sec.name
+                        
+                        if not sec.collapsed and len(sec.collections)>0:
+                            box = layout.box()
+                            if sec.outfit_enable:
+                                box.prop(sec,"outfit_body", text="Body", icon="OUTLINER_OB_MESH")
+                                if sec.outfit_body is not None:
+                                    row = box.row()
+                                    row.label(text="Manual Masks", icon="MOD_MASK")
+                                    mask_add = row.operator("mc.outfitmask", text="", icon="ADD")
+                                    mask_add.sec = sec.name
+                                    mask_add.remove = False
+                                    for j, mask in enumerate(sec.outfit_masks):
+                                        row = box.row(align=True)
+                                        row.prop(mask, "object", text="")
+                                        row.prop_search(mask, "modifier", sec.outfit_body, "modifiers", text="")
+                                        mask_del = row.operator("mc.outfitmask", text="", icon="X")
+                                        mask_del.sec = sec.name
+                                        mask_del.index = j
+                                        mask_del.remove = True
+                            
+                            if len(sec.collections)>0:
+                                box.label(text="Collection List", icon="OUTLINER_COLLECTION")
+                                box = box.box()
+                                for collection in sec.collections:
+                                    row = box.row()
+                                    row.label(text=collection.collection.name)
+                                    del_col = row.operator("mc.deletecollection",text="",icon="X")
+                                    del_col.sec = sec.name
+                                    del_col.col = collection.collection.name
+                                    
+                    else:
+                        if not sec.collapsed:
+                            box = layout.box()
+                            if sec_empty:
+                                row = box.row(align=False)
+                                row.label(text="No Collection Assigned", icon="ERROR")
+                                row.operator("mc.deletesection",text="",icon="X").name = sec.name
+                            
+                            if len(sec.collections)>0:
+                                box.prop(sec,"collections_list", text="")
+                                box2 = box.box()
+                                if len(bpy.data.collections[sec.collections_list].objects)>0:
+                                    for obj2 in bpy.data.collections[sec.collections_list].objects:
+                                        row = box2.row(align=True)
+                                        if obj2.hide_viewport:
+                                            vop=row.operator("mc.colobjvisibility",text=obj2.name, icon='OUTLINER_OB_'+obj2.type)
+                                            vop.obj = obj2.name
+                                            vop.sec = sec.name
+                                        else:
+                                            vop = row.operator("mc.colobjvisibility",text=obj2.name, icon='OUTLINER_OB_'+obj2.type, depress = True)
+                                            vop.obj = obj2.name
+                                            vop.sec = sec.name
+                                        solo = row.operator("mc.outfitsolo", text="", icon="SOLO_ON")
+                                        solo.obj = obj2.name
+                                        solo.sec = sec.name
+                                else:
+                                    box2.label(text="This Collection seems empty", icon="ERROR")
+                                
+                                # Outfit presets
+                                row = box.row()
+                                row.label(text="Presets", icon="PRESET")
+                                row.operator("mc.outfitpresetsave", text="", icon="ADD").sec = sec.name
+                                hide_all = row.operator("mc.outfitsolo", text="", icon="HIDE_ON")
+                                hide_all.obj = ""
+                                hide_all.sec = sec.name
+                                if len(sec.outfit_presets)>0:
+                                    col = box.column(align=True)
+                                    for preset in sec.outfit_presets:
+                                        row = col.row(align=True)
+                                        pop = row.operator("mc.outfitpresetapply", text=preset.name)
+                                        pop.sec = sec.name
+                                        pop.name = preset.name
+                                        pop.remove = False
+                                        if settings.ms_editmode:
+                                            pop = row.operator("mc.outfitpresetapply", text="", icon="X")
+                                            pop.sec = sec.name
+                                            pop.name = preset.name
+                                            pop.remove = True
+                                
+                                if sec.collections_enable_global_smoothcorrection or sec.collections_enable_global_shrinkwrap or sec.collections_enable_global_mask or sec.collections_enable_global_normalautosmooth:
+                                    box.label(text= "Global Properties", icon="MODIFIER")
+                                    box2 = box.box()
+                                    if sec.collections_enable_global_smoothcorrection:
+                                        box2.prop(sec,"collections_global_smoothcorrection")
+                                    if sec.collections_enable_global_shrinkwrap:
+                                        box2.prop(sec,"collections_global_shrinkwrap")
+                                    if sec.collections_enable_global_mask:
+                                        box2.prop(sec,"collections_global_mask")
+                                    if sec.collections_enable_global_normalautosmooth:
+                                        box2.prop(sec,"collections_global_normalautosmooth")
+                                                
+        else:
+            box = layout.box()
+            box.label(text="No section added.",icon="ERROR")
+                
+
+class PT_MenuCreator_Settings_Panel(MainPanel, bpy.types.Panel):
+    bl_idname = "PT_MenuCreator_Settings_Panel"
+    bl_label = "Settings"
+    
+    def draw(self, context):
+        
+        settings = bpy.context.scene.mc_settings
+        
+        layout = self.layout
+        
+        # Main Settings
+        layout.label(text="Main Settings",icon="SETTINGS")
+        box = layout.box()
+        
+        box.prop(settings,"ms_editmode")
+        box.prop(settings,"ms_debug")
+        box.prop(settings,"ms_profile")
+        box.prop(settings,"ms_advanced")
+        
+        # Rolling statistics recorded while profiling
+        if settings.ms_profile:
+            layout.label(text="Profiling",icon="TIME")
+            box = layout.box()
+            timings, caches = mc_stats_rows()
+            if len(timings) == 0 and len(caches) == 0:
+                box.label(text="No statistics recorded yet")
+            else:
+                col = box.column(align=True)
+                row = col.row()
+                row.label(text="Name")
+                row.label(text="Calls")
+                row.label(text="Avg / Max ms")
+                row.label(text="Last " + str(mc_stats_window) + " ms")
+                for stat in timings[:mc_stats_draw_max]:
+                    row = col.row()
+                    row.label(text=stat["name"])
+                    row.label(text=str(stat["calls"]))
+                    row.label(text="%.3f / %.3f" % (stat["avg_ms"], stat["max_ms"]))
+                    row.label(text="%.3f" % stat["rolling_ms"])
+                if len(caches) > 0:
+                    col = box.column(align=True)
+                    for cache in caches:
+                        row = col.row()
+                        row.label(text=cache["name"], icon="FILE_CACHE")
+                        row.label(text="%.1f%% of %d" % (cache["hit_rate"] * 100., cache["hits"] + cache["misses"]))
+            row = box.row()
+            row.operator('mc.profile_reset', icon="X")
+            row.operator('mc.profile_export', icon="EXPORT")
+        
+        # Menu specific settings
+        layout.label(text="Menu Settings",icon="SETTINGS")
+        box = layout.box()
+        
+        box.prop(settings,"mss_name")
+        box.prop(settings,"mss_obj_name")
+        
+        if settings.em_fixobj:
+            obj = settings.em_fixobj_pointer
+        else:
+            obj = context.active_object
+        if obj is not None and obj.mc_enable:
+            layout.label(text="Linked Properties",icon="LINKED")
+            box = layout.box()
+            if obj.mc_link_drivers:
+                box.label(text="Links synced by drivers", icon="DRIVER")
+                box.operator('mc.linkdrivers', text="Update Drivers", icon="FILE_REFRESH").remove = False
+                box.operator('mc.linkdrivers', text="Remove Drivers", icon="X").remove = True
+            else:
+                box.operator('mc.linkdrivers', text="Compile Links to Drivers", icon="DRIVER").remove = False
+        
+        if len(mc_link_cycles) > 0:
+            layout.label(text="Link Cycles",icon="ERROR")
+            box = layout.box()
+            for cycle in mc_link_cycles:
+                box.label(text=" -> ".join(cycle + cycle[:1]))
+        
+        layout.label(text="Reset functions",icon="SETTINGS")
+        box = layout.box()
+        
+        box.operator('mc.cleanpropobj', text="Reset Object", icon="ERROR").reset = True
+        box.operator('mc.cleanprop', text="Reset All Objects", icon="ERROR").reset = True
+
+# Handlers
+
+# Number of collections in the file during the last check, to detect deleted collections
+mc_collections_count = -1
+
+@persistent
+@mc_profiled("Handler: scene modification")
+def mc_scene_modification_handler(scene, depsgraph=None):
+    """Called at every modification done to the scene."""
+    global mc_collections_count, mc_animated_groups
+    
+    # During playback and rendering the links are synced by the frame change handler
+    if mc_rendering or mc_animation_playing():
+        return
+    # The animated links are computed again when the next playback starts
+    mc_animated_groups = None
+    
+    # Objects with a menu might have been duplicated, appended or removed: the registry is checked only when
+    # the number of objects changed, and the links are compiled again if the menu objects changed
+    if len(bpy.data.objects) != mc_registry_objects_count:
+        mc_registry_objects()
+    
+    # Handler for linked custom properties
+    # Without a depsgraph (undo and redo) all the links are synced
+    if depsgraph is None:
+        mc_links_sync()
+    else:
+        mc_links_sync(mc_depsgraph_changed_ids(depsgraph))
+    
+    # The collection lists need to be checked only when a collection has been removed
+    if len(bpy.data.collections) == mc_collections_count:
+        return
+    mc_collections_count = len(bpy.data.collections)
+    
+    for obj in mc_registry_objects():
+        
+        if mc_profiling:
+            start = time.perf_counter()
+        
+        # Part checking for changes in the list collection
+        # This is needed to ensure a clean list against deletion of collections from the outliner
+        for sec in obj.mc_sections:
+            i = 0
+            for el in sec.collections:
+                if not hasattr(el.collection, 'name'):
+                    sec.collections.remove(i)
+                i = i + 1
+        
+        if mc_profiling:
+            mc_stats_record("Collections check: " + obj.name, time.perf_counter() - start)
+
+@persistent
+@mc_profiled("Handler: frame change")
+def mc_frame_change_handler(scene, depsgraph=None):
+    """Called after a frame change. Syncs the animated links during playback and rendering."""
+    
+    # Frame changes from the timeline are handled by the depsgraph handler
+    if not mc_rendering and not mc_animation_playing():
+        return
+    
+    mc_links_sync_animated()
+
+@persistent
+def mc_render_init_handler(scene, depsgraph=None):
+    """Called when a render starts."""
+    global mc_rendering, mc_animated_groups
+    
+    mc_rendering = True
+    mc_animated_groups = None
+
+@persistent
+def mc_render_end_handler(scene, depsgraph=None):
+    """Called when a render is completed or cancelled."""
+    global mc_rendering, mc_animated_groups
+    
+    mc_rendering = False
+    mc_animated_groups = None
+
+@persistent
+def mc_undo_redo_handler(scene):
+    """Called after undo and redo. All the cached data-blocks are no longer valid."""
+    
+    mc_registry_clear()
+    mc_menu_caches_clear()
+    mc_links_invalidate(clear_cache=True)
+    mc_scene_modification_handler(scene)
+
+@persistent
+def mc_load_handler(dummy):
+    """Called after a file is loaded."""
+    global mc_profiling
+    
+    mc_profiling = bpy.context.scene.mc_settings.ms_profile
+    mc_registry_rebuild()
+    mc_menu_caches_clear()
+    mc_links_invalidate(clear_cache=True)
+    mc_migrate_menus()
+    mc_msgbus_subscribe()
+
+
+# Register
+
+classes = (
+    MC_AddProperty,
+    MC_LinkProperty,
+    MC_LinkPropertySearch,
+    WM_MT_button_context,
+    MC_RemoveProperty,
+    MC_CleanAll,
+    MC_CleanObject,
+    MC_RemoveLinkedProperty,
+    MC_LinkMapPoint,
+    MC_PropertySettings,
+    MC_SwapProperty,
+    MC_MoveProperty,
+    MC_AddSection,
+    MC_AddCollection,
+    MC_AddAllProperties,
+    MC_RemoveCollection,
+    MC_SectionSettings,
+    MC_SwapSection,
+    MC_MoveSection,
+    MC_DeleteSection,
+    MC_CollectionObjectVisibility,
+    MC_OutfitMask,
+    MC_OutfitPresetSave,
+    MC_OutfitPresetApply,
+    MC_OutfitSolo,
+    MC_LinkDrivers,
+    MC_ProfileReset,
+    MC_ProfileExport,
+    MC_InitialConfiguration,
+    OUTLINER_MT_link_mcmenu,
+    OUTLINER_MT_collection_mcmenu,
+    PT_MenuCreator_InitialConfiguration_Panel,
+    PT_MenuCreator_Panel,
+    PT_MenuCreator_Settings_Panel
+)
+
+def register():
+    
+    from bpy.utils import register_class
+    for cls in classes:
+        # The operators are timed while profiling
+        if cls.__name__.startswith("MC_") and not getattr(cls.execute, 'mc_profiled', False):
+            cls.execute = mc_profiled("Operator: " + cls.bl_idname)(cls.execute)
+        register_class(cls)
+    
+    bpy.types.WM_MT_button_context.append(menu_func)
+    bpy.types.WM_MT_button_context.append(menu_func_link)
+    bpy.types.OUTLINER_MT_collection.append(mc_collection_menu)
+    
+    # Handlers
+    bpy.app.handlers.depsgraph_update_post.append(mc_scene_modification_handler)
+    bpy.app.handlers.frame_change_post.append(mc_frame_change_handler)
+    bpy.app.handlers.render_init.append(mc_render_init_handler)
+    bpy.app.handlers.render_complete.append(mc_render_end_handler)
+    bpy.app.handlers.render_cancel.append(mc_render_end_handler)
+    bpy.app.handlers.redo_post.append(mc_undo_redo_handler)
+    bpy.app.handlers.undo_post.append(mc_undo_redo_handler)
+    bpy.app.handlers.load_post.append(mc_load_handler)
+    mc_msgbus_subscribe()
+
+def unregister():
+    
+    from bpy.utils import unregister_class
+    for cls in reversed(classes):
+        unregister_class(cls)
+    
+    bpy.types.WM_MT_button_context.remove(menu_func)
+    bpy.types.WM_MT_button_context.remove(menu_func_link)
+    bpy.types.OUTLINER_MT_collection.remove(mc_collection_menu)
+    
+    # Handlers
+    bpy.app.handlers.depsgraph_update_post.remove(mc_scene_modification_handler)
+    bpy.app.handlers.frame_change_post.remove(mc_frame_change_handler)
+    bpy.app.handlers.render_init.remove(mc_render_init_handler)
+    bpy.app.handlers.render_complete.remove(mc_render_end_handler)
+    bpy.app.handlers.render_cancel.remove(mc_render_end_handler)
+    bpy.app.handlers.redo_post.remove(mc_undo_redo_handler)
+    bpy.app.handlers.undo_post.remove(mc_undo_redo_handler)
+    bpy.app.handlers.load_post.remove(mc_load_handler)
+    bpy.msgbus.clear_by_owner(mc_msgbus_owner)
+
+if __name__ == "__main__":
+    register()
+    
\ No newline at end of file
@@ -0,0 +1,475 @@
+# Menu Creator core
+# Menu model and algorithms that do not depend on bpy, so that they can be tested and benchmarked
+# without running Blender. The functions work on any object with the same attributes of the
+# PropertyGroups of the addon (MCSectionItem, MCPropertyItem, MCLinkedPropertyItem), so the same code
+# runs on the bpy collections of the addon and on the plain classes defined here
+
+import math
+from collections import deque
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# MENU MODEL
+# Plain Python counterparts of the PropertyGroups of the addon
+
+# Class to store collections for section informations
+class MCCollection:
+    
+    def __init__(self, collection=None):
+        self.collection = collection
+
+# Class to store section informations
+class MCSection:
+    
+    def __init__(self, name, id=0, type="DEFAULT", icon="NONE"):
+        self.name = name
+        self.id = id
+        self.type = type
+        self.icon = icon
+        self.collapsable = False
+        self.collapsed = False
+        self.collections = []
+        self.outfit_enable = False
+        self.outfit_body = None
+
+# Class to store the points of the remap curve of a linked property
+class MCMapPoint:
+    
+    def __init__(self, x=0., y=0.):
+        self.x = x
+        self.y = y
+
+# Class to store linked properties informations
+class MCLinkedProperty:
+    
+    def __init__(self, path, id):
+        self.path = path
+        self.id = id
+        self.map_enable = False
+        self.map_factor = 1.
+        self.map_offset = 0.
+        self.map_clamp = False
+        self.map_min = 0.
+        self.map_max = 1.
+        self.map_invert = False
+        self.map_curve = False
+        self.map_points = []
+
+# Class to store properties informations
+class MCProperty:
+    
+    def __init__(self, name, path, id, section="Unsorted", mc_id=0):
+        self.name = name
+        self.path = path
+        self.id = id
+        self.section = section
+        self.mc_id = mc_id
+        self.icon = "NONE"
+        self.hide = False
+        self.select = False
+        self.linked_props = []
+        self.link_bidirectional = False
+
+# Class to store the menu of an object
+class MCMenu:
+    
+    def __init__(self, name):
+        self.name = name
+        self.mc_properties = []
+        self.mc_sections = [MCSection("Unsorted", 0, icon="LIBRARY_DATA_BROKEN")]
+
+
+# MENU INDICES
+
+# Function to compute the draw plan of a menu
+# The plan is a list of (section index, property indices, empty, hidden) in the order the sections are drawn
+# The property indices are sorted by mc_id. A section is hidden if all its properties are hidden
+def mc_draw_plan_build(properties, sections):
+    
+    rows = {}
+    visible = set()
+    i = 0
+    for el in properties:
+        rows.setdefault(el.section, []).append((el.mc_id, i))
+        if not el.hide:
+            visible.add(el.section)
+        i = i + 1
+    
+    plan = []
+    for sec_index, sec in sorted(enumerate(sections), key = lambda x: x[1].id):
+        sec_rows = [el_index for el_id, el_index in sorted(rows.get(sec.name, []))] if sec.type == "DEFAULT" else []
+        plan.append( (sec_index, sec_rows, len(sec_rows) == 0, sec.name not in visible) )
+    
+    return plan
+
+# Function to compute the indices of the properties of a menu
+# Return ({(path, id): index}, {section name: [indices]}, max mc_id)
+def mc_property_indices_build(properties):
+    
+    index = {}
+    sections = {}
+    max_id = None
+    i = 0
+    for el in properties:
+        index[(el.path, el.id)] = i
+        sections.setdefault(el.section, []).append(i)
+        if max_id is None or el.mc_id > max_id:
+            max_id = el.mc_id
+        i = i + 1
+    
+    return index, sections, max_id
+
+# Function to compute the indices of the sections of a menu
+# Return ({name: index}, {id: index}, max id)
+def mc_section_indices_build(sections):
+    
+    by_name = {}
+    by_id = {}
+    max_id = None
+    i = 0
+    for el in sections:
+        by_name[el.name] = i
+        by_id[el.id] = i
+        if max_id is None or el.id > max_id:
+            max_id = el.id
+        i = i + 1
+    
+    return by_name, by_id, max_id
+
+
+# ORDERING
+
+# Properties (mc_id) and sections (id) are ordered by sparse ordering ids, so that moving
+# elements only rewrites the moved elements. When there is no room left between two ids,
+# the whole list is compacted
+
+# Distance between consecutive ordering ids after a compaction
+mc_order_step = 1024
+# Maximum absolute value of the ordering ids, before a compaction is needed
+mc_order_max = 2**30
+
+# Function to compute count ordering ids between low and high (None for no bound)
+# Return None if there is no room between low and high
+def mc_order_keys_between(low, high, count):
+    
+    if low is None and high is None:
+        keys = [i*mc_order_step for i in range(count)]
+    elif low is None:
+        keys = [high - (count-i)*mc_order_step for i in range(count)]
+    elif high is None:
+        keys = [low + (i+1)*mc_order_step for i in range(count)]
+    else:
+        gap = (high - low) // (count + 1)
+        if gap < 1:
+            return None
+        keys = [low + (i+1)*gap for i in range(count)]
+    
+    if count > 0 and (keys[0] < -mc_order_max or keys[-1] > mc_order_max):
+        return None
+    
+    return keys
+
+# Function to renumber the elements with evenly spaced ordering ids, starting from start
+# order is the list of collection indices, in the wanted order
+def mc_order_compact(collection, order, attr, start=0):
+    
+    i = 0
+    for k in order:
+        setattr(collection[k], attr, start + i*mc_order_step)
+        i = i + 1
+
+# Function to move elements of a collection to a new position
+# order: list of collection indices sorted by their ordering id (attribute attr)
+# moved: collection indices of the elements to move, that will keep their relative order
+# position: the new position, counted in the list without the moved elements
+# minimum: if not None, all the ordering ids must be greater than this value
+def mc_order_move(collection, order, moved, position, attr, minimum=None):
+    
+    moved_set = set(moved)
+    moved = [k for k in order if k in moved_set]
+    rest = [k for k in order if k not in moved_set]
+    position = max(0, min(position, len(rest)))
+    
+    low = getattr(collection[rest[position-1]], attr) if position > 0 else minimum
+    high = getattr(collection[rest[position]], attr) if position < len(rest) else None
+    keys = mc_order_keys_between(low, high, len(moved))
+    
+    if keys is None:
+        # No room left between the neighbours
+        mc_order_compact(collection, rest[:position] + moved + rest[position:], attr, 0 if minimum is None else minimum + mc_order_step)
+    else:
+        for k, key in zip(moved, keys):
+            setattr(collection[k], attr, key)
+
+# Function to get the new position of moved elements
+# order: collection indices sorted by ordering id, moved: the moved indices in the same order
+# position: 'UP', 'DOWN', 'TOP', 'BOTTOM' or 'INDEX' (using index)
+# Return None if the elements can not be moved in that direction
+def mc_order_position(order, moved, position, index=0):
+    
+    first = order.index(moved[0])
+    last = order.index(moved[-1]) - len(moved) + 1
+    
+    if position == "UP":
+        return first - 1 if first > 0 else None
+    elif position == "DOWN":
+        return last + 1 if last + len(moved) < len(order) else None
+    elif position == "TOP":
+        return 0
+    elif position == "BOTTOM":
+        return len(order) - len(moved)
+    
+    return index
+
+
+# PATHS
+
+# Function to quote a name in a property path, as done by Blender when copying data paths
+# Drivers and fcurves store custom properties in the same form, e.g. ["name"]
+def mc_path_quote(name):
+    return '"' + name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+# Function to join the path of a struct relative to its ID and the identifier of one of its properties
+# The identifier is an attribute name, or ["name"] for custom properties
+def mc_path_join(path, id):
+    if path == "":
+        return id
+    if id.startswith('['):
+        return path + id
+    return path + '.' + id
+
+
+# LINKED PROPERTIES
+
+# Function to convert a property value to something that can be compared with the last synced value
+def mc_value_copy(value):
+    if isinstance(value, str):
+        return value
+    if hasattr(value, '__len__'):
+        return tuple(value)
+    return value
+
+# Function to check if a property with signature link can be linked to a property with signature source
+# The subtype is not checked, so that, for instance, a float custom property can be linked to a shape key value
+def mc_signatures_compatible(source, link):
+    
+    if source is None or link is None:
+        return False
+    
+    return source[0] == link[0] and source[1] == link[1] and source[3] == link[3]
+
+# Function to evaluate a remap curve, given as sorted lists of inputs and outputs, with linear interpolation
+def mc_map_curve(xs, ys, x):
+    
+    if x <= xs[0]:
+        return ys[0]
+    for i in range(1, len(xs)):
+        if x <= xs[i]:
+            if xs[i] == xs[i-1]:
+                return ys[i]
+            return ys[i-1] + (ys[i] - ys[i-1]) * (x - xs[i-1]) / (xs[i] - xs[i-1])
+    return ys[-1]
+
+# Class to store the mapping of the targets of a link group, compiled from the linked property items
+# The mapped values of all the targets are evaluated together, with NumPy when available
+class MCLinkMap:
+    
+    def __init__(self, targets, items):
+        self.targets = targets
+        self.invert = [item.map_invert for item in items]
+        self.factor = [item.map_factor for item in items]
+        self.offset = [item.map_offset for item in items]
+        self.min = [item.map_min if item.map_clamp else -math.inf for item in items]
+        self.max = [item.map_max if item.map_clamp else math.inf for item in items]
+        # Remap curves as (inputs, outputs) sorted by input, None if not used
+        self.curves = []
+        for item in items:
+            points = sorted((p.x, p.y) for p in item.map_points)
+            if item.map_curve and len(points) > 0:
+                self.curves.append(([p[0] for p in points], [p[1] for p in points]))
+            else:
+                self.curves.append(None)
+        if numpy is not None:
+            self.factor = numpy.array(self.factor)
+            self.offset = numpy.array(self.offset)
+            self.min = numpy.array(self.min)
+            self.max = numpy.array(self.max)
+    
+    # Compute the values to write to the targets
+    # Strings and enums are not mapped, booleans can only be inverted
+    def evaluate(self, value):
+        
+        if isinstance(value, str):
+            return [value] * len(self.targets)
+        
+        sample = value[0] if isinstance(value, tuple) and len(value) > 0 else value
+        if isinstance(sample, bool):
+            if isinstance(value, tuple):
+                inverted = tuple(not v for v in value)
+            else:
+                inverted = not value
+            return [inverted if i else value for i in self.invert]
+        
+        if numpy is not None:
+            x = numpy.asarray(value, dtype=numpy.float64)
+            y = numpy.stack([x if c is None else numpy.interp(x, c[0], c[1]) for c in self.curves])
+            shape = (-1,) + (1,) * x.ndim
+            y = numpy.clip(y * self.factor.reshape(shape) + self.offset.reshape(shape), self.min.reshape(shape), self.max.reshape(shape))
+            if isinstance(sample, int):
+                y = numpy.rint(y).astype(numpy.int64)
+            y = y.tolist()
+            if isinstance(value, tuple):
+                return [tuple(v) for v in y]
+            return y
+        
+        values = []
+        for i in range(len(self.targets)):
+            x = value if isinstance(value, tuple) else (value,)
+            if self.curves[i] is not None:
+                x = [mc_map_curve(self.curves[i][0], self.curves[i][1], v) for v in x]
+            y = [min(max(v * self.factor[i] + self.offset[i], self.min[i]), self.max[i]) for v in x]
+            if isinstance(sample, int):
+                y = [int(round(v)) for v in y]
+            values.append(tuple(y) if isinstance(value, tuple) else y[0])
+        return values
+
+# Function to find the cycles in the link graph, as lists of groups
+# The nodes given are the ones left by the topological sort, so each of them lies on or between cycles
+def mc_links_cycles(nodes):
+    
+    # Drop the nodes downstream of the cycles, which have no outgoing edges left
+    nodes = set(nodes)
+    trimmed = True
+    while trimmed:
+        trimmed = False
+        for group in list(nodes):
+            if not any(d in nodes for d in group.downstream):
+                nodes.remove(group)
+                trimmed = True
+    
+    # Walk along the edges until a node is visited again: the walk from that node is a cycle
+    cycles = []
+    visited = set()
+    for start in nodes:
+        if start in visited:
+            continue
+        path = []
+        position = {}
+        group = start
+        while group not in visited and group not in position:
+            position[group] = len(path)
+            path.append(group)
+            group = next(d for d in group.downstream if d in nodes)
+        if group in position:
+            cycles.append(path[position[group]:])
+        visited.update(path)
+    
+    return cycles
+
+# Function to sort the link groups in topological order, so that a chain of links is synced in one pass
+# The groups need the inputs and outputs attributes, lists of accessors with an identity attribute
+# The downstream and rank attributes of the groups are set. Groups in cycles are placed last
+# Bidirectional groups read and write all their members, but are not considered as cycles themselves
+# Return the sorted groups and the cycles found
+def mc_links_order(groups):
+    
+    # A group is upstream of another if it writes a property read by the other group
+    readers = {}
+    for group in groups:
+        for member in group.inputs:
+            readers.setdefault(member.identity, []).append(group)
+    
+    degree = {}
+    for group in groups:
+        degree[group] = 0
+    for group in groups:
+        downstream = []
+        for target in group.outputs:
+            for reader in readers.get(target.identity, ()):
+                if reader is not group and reader not in downstream:
+                    downstream.append(reader)
+        group.downstream = downstream
+        for reader in downstream:
+            degree[reader] += 1
+    
+    # Kahn algorithm, keeping the collection order among independent groups
+    order = []
+    queue = deque(g for g in groups if degree[g] == 0)
+    while len(queue) > 0:
+        group = queue.popleft()
+        order.append(group)
+        for reader in group.downstream:
+            degree[reader] -= 1
+            if degree[reader] == 0:
+                queue.append(reader)
+    
+    remaining = [g for g in groups if degree[g] > 0]
+    cycles = mc_links_cycles(remaining)
+    
+    order.extend(remaining)
+    for i, group in enumerate(order):
+        group.rank = i
+    
+    return order, cycles
+
+# OUTFITS
+
+# Function to map the outfit objects to the mask modifiers of the outfit body
+# objects: names of the outfit objects, modifiers: names of the MASK modifiers of the body
+# mode: 'CONTAINS' (the modifier name contains the object name), 'EXACT' (the names are equal),
+# 'PREFIX' (the modifier name starts with the object name) or 'POINTER' (only the explicit assignments)
+# assignments: (object name, modifier name) pairs, used in every mode
+# With name matching, each modifier is assigned to the object with the longest matching name,
+# so that the masks of "Shirt_Long" are not toggled by "Shirt"
+# Return {object name: [modifier names]}
+def mc_mask_map_build(objects, modifiers, mode, assignments=()):
+    
+    mask_map = {}
+    modifiers_set = set(modifiers)
+    
+    if mode == "EXACT":
+        for name in objects:
+            if name in modifiers_set:
+                mask_map.setdefault(name, []).append(name)
+    
+    elif mode == "PREFIX":
+        objects_set = set(objects)
+        for modifier in modifiers:
+            for length in range(len(modifier), 0, -1):
+                if modifier[:length] in objects_set:
+                    mask_map.setdefault(modifier[:length], []).append(modifier)
+                    break
+    
+    elif mode == "CONTAINS":
+        by_length = sorted(set(objects), key=len, reverse=True)
+        for modifier in modifiers:
+            for name in by_length:
+                if name in modifier:
+                    mask_map.setdefault(name, []).append(modifier)
+                    break
+    
+    for name, modifier in assignments:
+        if modifier in modifiers_set and modifier not in mask_map.get(name, ()):
+            mask_map.setdefault(name, []).append(modifier)
+    
+    return mask_map
+
+# Function to encode a list of flags as a hexadecimal bitset, the first flag being the lowest bit
+def mc_bitset_encode(flags):
+    
+    value = 0
+    for i, flag in enumerate(flags):
+        if flag:
+            value |= 1 << i
+    
+    return format(value, 'x')
+
+# Function to decode count flags from a hexadecimal bitset
+def mc_bitset_decode(bits, count):
+    
+    value = int(bits, 16) if bits != "" else 0
+    
+    return [bool(value >> i & 1) for i in range(count)]
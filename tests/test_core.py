@@ -0,0 +1,282 @@
+# Menu Creator core tests
+#
+# Tests of the algorithms of menu_creator/core.py, that run without Blender.
+# Run them from the root of the repository with:
+#
+#   python -m pytest tests
+#
+# or, without pytest, with:
+#
+#   python -m unittest discover tests
+
+import ast
+import os
+import sys
+import unittest
+from unittest import mock
+
+# The core module does not depend on bpy, so it is imported without the addon package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "menu_creator"))
+import core
+
+
+# Helpers
+
+# Function to create a menu with count properties in the same section
+def make_properties(count, section="Section", step=core.mc_order_step):
+    return [core.MCProperty("prop_" + str(i), "path", "prop_" + str(i), section, i * step) for i in range(count)]
+
+# Function to get the names of the properties sorted by their ordering id
+def ordered_names(properties):
+    return [p.name for p in sorted(properties, key=lambda p: p.mc_id)]
+
+# Accessor and link group stand-ins for the link graph, identified by a property name
+class Accessor:
+
+    def __init__(self, identity):
+        self.identity = identity
+
+class LinkGroup:
+
+    def __init__(self, name, source, targets, bidirectional=False):
+        self.name = name
+        members = [Accessor(source)] + [Accessor(t) for t in targets]
+        self.inputs = members if bidirectional else members[:1]
+        self.outputs = members if bidirectional else members[1:]
+
+    def __repr__(self):
+        return self.name
+
+# Function to create a linked property with a mapping
+def make_link(factor=1., offset=0., clamp=False, minimum=0., maximum=1., invert=False, points=None):
+
+    link = core.MCLinkedProperty("path", "id")
+    link.map_enable = True
+    link.map_factor = factor
+    link.map_offset = offset
+    link.map_clamp = clamp
+    link.map_min = minimum
+    link.map_max = maximum
+    link.map_invert = invert
+    if points is not None:
+        link.map_curve = True
+        link.map_points = [core.MCMapPoint(x, y) for x, y in points]
+
+    return link
+
+
+# Ordering
+
+class OrderTest(unittest.TestCase):
+
+    def test_keys_between_bounds(self):
+        self.assertEqual(core.mc_order_keys_between(None, None, 3), [0, core.mc_order_step, 2 * core.mc_order_step])
+        self.assertEqual(core.mc_order_keys_between(10, None, 2), [10 + core.mc_order_step, 10 + 2 * core.mc_order_step])
+        self.assertEqual(core.mc_order_keys_between(None, 10, 2), [10 - 2 * core.mc_order_step, 10 - core.mc_order_step])
+        self.assertEqual(core.mc_order_keys_between(0, 30, 2), [10, 20])
+
+    def test_keys_between_no_room(self):
+        self.assertIsNone(core.mc_order_keys_between(0, 2, 2))
+        self.assertIsNone(core.mc_order_keys_between(core.mc_order_max, None, 1))
+
+    def test_compact(self):
+        properties = make_properties(3, step=1)
+        core.mc_order_compact(properties, [2, 0, 1], "mc_id")
+        self.assertEqual(ordered_names(properties), ["prop_2", "prop_0", "prop_1"])
+        self.assertEqual(sorted(p.mc_id for p in properties), [0, core.mc_order_step, 2 * core.mc_order_step])
+
+    def test_position(self):
+        order = [0, 1, 2, 3]
+        self.assertEqual(core.mc_order_position(order, [1], "UP"), 0)
+        self.assertIsNone(core.mc_order_position(order, [0], "UP"))
+        self.assertEqual(core.mc_order_position(order, [1, 2], "DOWN"), 2)
+        self.assertIsNone(core.mc_order_position(order, [3], "DOWN"))
+        self.assertEqual(core.mc_order_position(order, [2], "TOP"), 0)
+        self.assertEqual(core.mc_order_position(order, [1, 2], "BOTTOM"), 2)
+        self.assertEqual(core.mc_order_position(order, [1], "INDEX", 2), 2)
+
+    def test_move_only_rewrites_moved(self):
+        properties = make_properties(4)
+        before = [p.mc_id for p in properties]
+        core.mc_order_move(properties, [0, 1, 2, 3], [3], 1, "mc_id")
+        self.assertEqual(ordered_names(properties), ["prop_0", "prop_3", "prop_1", "prop_2"])
+        self.assertEqual([p.mc_id for p in properties[:3]], before[:3])
+
+    def test_move_keeps_relative_order(self):
+        properties = make_properties(5)
+        core.mc_order_move(properties, [0, 1, 2, 3, 4], [3, 1], 0, "mc_id")
+        self.assertEqual(ordered_names(properties), ["prop_1", "prop_3", "prop_0", "prop_2", "prop_4"])
+
+    def test_move_compacts_without_room(self):
+        properties = make_properties(3, step=1)
+        core.mc_order_move(properties, [0, 1, 2], [2], 1, "mc_id")
+        self.assertEqual(ordered_names(properties), ["prop_0", "prop_2", "prop_1"])
+        self.assertEqual(sorted(p.mc_id for p in properties), [0, core.mc_order_step, 2 * core.mc_order_step])
+
+    def test_move_minimum(self):
+        sections = [core.MCSection("Unsorted", 0), core.MCSection("A", 1), core.MCSection("B", 2)]
+        core.mc_order_move(sections, [1, 2], [2], 0, "id", minimum=0)
+        self.assertEqual([s.name for s in sorted(sections, key=lambda s: s.id)], ["Unsorted", "B", "A"])
+        self.assertTrue(all(s.id > 0 for s in sections[1:]))
+
+
+# Paths
+
+class PathTest(unittest.TestCase):
+
+    def test_quote_as_blender(self):
+        # Drivers and fcurves store custom properties as ["name"], never as ['name']
+        self.assertEqual(core.mc_path_quote("my_prop"), '"my_prop"')
+        self.assertEqual(core.mc_path_quote('a"b\\c'), '"a\\"b\\\\c"')
+
+    def test_quote_round_trip(self):
+        # The accessors read the custom property name back from the identifier
+        for name in ["my_prop", "with space", 'quote"d', "back\\slash"]:
+            self.assertEqual(ast.literal_eval(core.mc_path_quote(name)), name)
+
+    def test_join_custom_property(self):
+        self.assertEqual(core.mc_path_join("", '["my_prop"]'), '["my_prop"]')
+        self.assertEqual(core.mc_path_join('pose.bones["Bone"]', '["my_prop"]'), 'pose.bones["Bone"]["my_prop"]')
+
+    def test_join_attribute(self):
+        self.assertEqual(core.mc_path_join("", "hide_viewport"), "hide_viewport")
+        self.assertEqual(core.mc_path_join('key_blocks["Smile"]', "value"), 'key_blocks["Smile"].value')
+
+
+# Link graph
+
+class LinksOrderTest(unittest.TestCase):
+
+    def test_chain_sorted(self):
+        c = LinkGroup("c", "z", ["w"])
+        b = LinkGroup("b", "y", ["z"])
+        a = LinkGroup("a", "x", ["y"])
+        order, cycles = core.mc_links_order([c, b, a])
+        self.assertEqual(order, [a, b, c])
+        self.assertEqual([g.rank for g in order], [0, 1, 2])
+        self.assertEqual(a.downstream, [b])
+        self.assertEqual(cycles, [])
+
+    def test_independent_groups_keep_order(self):
+        a = LinkGroup("a", "x", ["y"])
+        b = LinkGroup("b", "z", ["w"])
+        order, cycles = core.mc_links_order([b, a])
+        self.assertEqual(order, [b, a])
+        self.assertEqual(cycles, [])
+
+    def test_cycle_found(self):
+        a = LinkGroup("a", "x", ["y"])
+        b = LinkGroup("b", "y", ["x"])
+        c = LinkGroup("c", "y", ["z"])
+        order, cycles = core.mc_links_order([a, b, c])
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(set(cycles[0]), {a, b})
+        # Groups in and downstream of cycles are placed last
+        self.assertEqual(set(order), {a, b, c})
+
+    def test_cycles_ignore_downstream_groups(self):
+        a = LinkGroup("a", "x", ["y"])
+        b = LinkGroup("b", "y", ["x", "z"])
+        c = LinkGroup("c", "z", ["w"])
+        order, cycles = core.mc_links_order([a, b, c])
+        self.assertEqual([set(cycle) for cycle in cycles], [{a, b}])
+        self.assertEqual(order[-1], c)
+
+    def test_bidirectional_group_is_not_a_cycle(self):
+        a = LinkGroup("a", "x", ["y"], bidirectional=True)
+        b = LinkGroup("b", "y", ["z"])
+        order, cycles = core.mc_links_order([b, a])
+        self.assertEqual(order, [a, b])
+        self.assertEqual(cycles, [])
+
+
+# Mapping
+
+class LinkMapTest:
+
+    def test_factor_offset(self):
+        mapping = core.MCLinkMap([None, None], [make_link(2.), make_link(1., 0.5)])
+        self.assertEqual(mapping.evaluate(0.25), [0.5, 0.75])
+
+    def test_clamp(self):
+        mapping = core.MCLinkMap([None], [make_link(4., clamp=True, minimum=0., maximum=1.)])
+        self.assertEqual(mapping.evaluate(0.5), [1.])
+        self.assertEqual(mapping.evaluate(-0.5), [0.])
+
+    def test_curve(self):
+        mapping = core.MCLinkMap([None], [make_link(points=[(1., 0.), (0., 1.)])])
+        self.assertAlmostEqual(mapping.evaluate(0.25)[0], 0.75)
+        self.assertAlmostEqual(mapping.evaluate(2.)[0], 0.)
+
+    def test_int_rounded(self):
+        mapping = core.MCLinkMap([None], [make_link(0.5)])
+        result = mapping.evaluate(3)
+        self.assertEqual(result, [2])
+        self.assertIsInstance(result[0], int)
+
+    def test_array(self):
+        mapping = core.MCLinkMap([None, None], [make_link(2.), make_link(1., 1.)])
+        self.assertEqual(mapping.evaluate((0.5, 1.)), [(1., 2.), (1.5, 2.)])
+
+    def test_bool_invert(self):
+        mapping = core.MCLinkMap([None, None], [make_link(invert=True), make_link()])
+        self.assertEqual(mapping.evaluate(True), [False, True])
+        self.assertEqual(mapping.evaluate((True, False)), [(False, True), (True, False)])
+
+    def test_string_not_mapped(self):
+        mapping = core.MCLinkMap([None], [make_link(2.)])
+        self.assertEqual(mapping.evaluate("A"), ["A"])
+
+class LinkMapFallbackTest(LinkMapTest, unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(core, "numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+@unittest.skipIf(core.numpy is None, "NumPy is not installed")
+class LinkMapNumpyTest(LinkMapTest, unittest.TestCase):
+    pass
+
+
+# Outfits
+
+class MaskMapTest(unittest.TestCase):
+
+    def test_contains_longest_match(self):
+        mask_map = core.mc_mask_map_build(["Shirt", "Shirt_Long"], ["Mask Shirt", "Mask Shirt_Long"], "CONTAINS")
+        self.assertEqual(mask_map, {"Shirt": ["Mask Shirt"], "Shirt_Long": ["Mask Shirt_Long"]})
+
+    def test_prefix(self):
+        mask_map = core.mc_mask_map_build(["Shirt", "Shirt_Long"], ["Shirt Mask", "Shirt_Long Mask", "Mask Shirt"], "PREFIX")
+        self.assertEqual(mask_map, {"Shirt": ["Shirt Mask"], "Shirt_Long": ["Shirt_Long Mask"]})
+
+    def test_exact(self):
+        mask_map = core.mc_mask_map_build(["Shirt", "Pants"], ["Shirt", "Pants Mask"], "EXACT")
+        self.assertEqual(mask_map, {"Shirt": ["Shirt"]})
+
+    def test_pointer_only_assignments(self):
+        mask_map = core.mc_mask_map_build(["Shirt"], ["Mask Shirt", "Mask A"], "POINTER", [("Shirt", "Mask A"), ("Shirt", "Missing")])
+        self.assertEqual(mask_map, {"Shirt": ["Mask A"]})
+
+    def test_assignments_added_once(self):
+        mask_map = core.mc_mask_map_build(["Shirt"], ["Mask Shirt", "Mask A"], "CONTAINS", [("Shirt", "Mask Shirt"), ("Shirt", "Mask A")])
+        self.assertEqual(mask_map, {"Shirt": ["Mask Shirt", "Mask A"]})
+
+class BitsetTest(unittest.TestCase):
+
+    def test_encode(self):
+        self.assertEqual(core.mc_bitset_encode([]), "0")
+        self.assertEqual(core.mc_bitset_encode([True, False, True, True]), "d")
+
+    def test_round_trip(self):
+        flags = [i % 3 == 0 for i in range(70)]
+        self.assertEqual(core.mc_bitset_decode(core.mc_bitset_encode(flags), 70), flags)
+
+    def test_decode_empty_and_short(self):
+        self.assertEqual(core.mc_bitset_decode("", 2), [False, False])
+        self.assertEqual(core.mc_bitset_decode("1", 3), [True, False, False])
+
+
+if __name__ == "__main__":
+    unittest.main()